@@ -0,0 +1,75 @@
+##########################################################################################
+# Date : 18 Oct 2026
+# Benchmark: details_bench
+# This script times the accumulation of the batting or bowling details of a team, by 
+# concatenating and sorting the details after every match as before, and by collecting 
+# the details of the matches and combining them once with combineDetails()
+#
+# Usage
+#
+# python benchmarks/details_bench.py ../data "Chennai Super Kings"
+# python benchmarks/details_bench.py ../data "Chennai Super Kings" --kind bowling --copies 4
+###########################################################################################
+import argparse
+import time
+import pandas as pd
+import yorkpy.analytics as analytics
+
+def getMatchParts(team, dir, kind):
+    '''
+    Get the details of each match of a team, as they are passed to combineDetails() by 
+    getTeamBattingDetails() or getTeamBowlingDetails(), and the time of the whole call
+    '''
+    captured = []
+    combineDetails = analytics.combineDetails
+    def capture(parts, by=None):
+        captured.append((list(parts), by))
+        return(combineDetails(parts, by))
+    getDetails = analytics.getTeamBattingDetails if kind == 'batting' else analytics.getTeamBowlingDetails
+    analytics.combineDetails = capture
+    try:
+        start = time.perf_counter()
+        getDetails(team, dir=dir, save=False, odir=".")
+        elapsed = time.perf_counter() - start
+    finally:
+        analytics.combineDetails = combineDetails
+    parts, by = captured[0]
+    return(parts, by, elapsed)
+
+def concatEachMatch(parts, by):
+    # The loop of getTeamBattingDetails() and getTeamBowlingDetails() before the change
+    details = pd.DataFrame()
+    for part in parts:
+        details = pd.concat([details, part])
+        details = details.sort_values(by)
+    return(details)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare concat+sort per match with combining the details once")
+    parser.add_argument("dir", help="Directory of the converted matches")
+    parser.add_argument("team", help="Team whose details are accumulated")
+    parser.add_argument("--kind", default="batting", choices=["batting", "bowling"])
+    parser.add_argument("--copies", type=int, default=1, 
+                        help="Number of times the matches are repeated, to time a longer history")
+    args = parser.parse_args()
+
+    parts, by, elapsed = getMatchParts(args.team, args.dir, args.kind)
+    parts = parts * args.copies
+    print("Matches=", len(parts), "Rows=", sum(len(part) for part in parts))
+    print("%s details of %s: %.2fs" % (args.kind, args.team, elapsed))
+
+    start = time.perf_counter()
+    old = concatEachMatch(parts, by)
+    slow = time.perf_counter() - start
+    start = time.perf_counter()
+    new = analytics.combineDetails(parts, by)
+    fast = time.perf_counter() - start
+    print("concat+sort per match: %.2fs" % slow)
+    print("combineDetails:        %.2fs" % fast)
+    print("Speedup: %.1fx" % (slow / fast))
+    # The old sort was not stable, so rows with the same keys are compared in any order
+    rows = lambda df: sorted(pd.util.hash_pandas_object(df.astype(str), index=False))
+    print("Same details:", list(old[by].values.ravel()) == list(new[by].values.ravel()) and rows(old) == rows(new))
+
+if __name__ == "__main__":
+    main()
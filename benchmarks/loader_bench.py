@@ -0,0 +1,52 @@
+##########################################################################################
+# Date : 18 Oct 2026
+# Benchmark: loader_bench
+# This script times the parsing of the Cricsheet yaml files of a directory or zip archive 
+# with the libyaml CSafeLoader and with the pure Python SafeLoader
+#
+# Usage
+#
+# python benchmarks/loader_bench.py ../yamldir
+# python benchmarks/loader_bench.py ../ipl.zip --files 200 --repeat 3
+###########################################################################################
+import argparse
+import time
+import yaml
+from yorkpy.analytics import listMatchFiles, readMatchFile
+
+def timeLoader(loader, contents, repeat):
+    '''
+    Parse the contents of all the files with a loader and return the best time of the
+    repeats, and the parsed matches
+    '''
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        matches = [yaml.load(content, Loader=loader) for content in contents]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return(best, matches)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CSafeLoader and SafeLoader on Cricsheet yaml files")
+    parser.add_argument("source", help="Directory or zip archive of yaml files")
+    parser.add_argument("--files", type=int, default=None, help="Number of files to parse. All if not given")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of times the files are parsed")
+    args = parser.parse_args()
+
+    if not yaml.__with_libyaml__:
+        raise SystemExit("PyYAML was built without libyaml, so CSafeLoader is not available")
+    files = sorted(listMatchFiles(args.source, '.yaml'))[:args.files]
+    # The files are read once so that only the parsing is timed
+    contents = [readMatchFile(file, args.source) for file in files]
+    print("Files=", len(files), "MB=", round(sum(len(c) for c in contents) / 1e6, 1))
+
+    fast, fastMatches = timeLoader(yaml.CSafeLoader, contents, args.repeat)
+    slow, slowMatches = timeLoader(yaml.SafeLoader, contents, args.repeat)
+    print("CSafeLoader: %.2fs (%.1f ms/file)" % (fast, 1000 * fast / len(files)))
+    print("SafeLoader:  %.2fs (%.1f ms/file)" % (slow, 1000 * slow / len(files)))
+    print("Speedup: %.1fx" % (slow / fast))
+    print("Same matches:", fastMatches == slowMatches)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+# Low level aggregation of deliveries. The key columns e.g. the batsman, or the match, team and
+# bowler, are factorized to integer codes once and the counts and sums of each group are
+# computed with np.bincount over the codes, instead of a pandas groupby over the names
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getGroupCodes
+# This function numbers the groups of the key columns of deliveries
+#
+
+###########################################################################################
+def getGroupCodes(df, keys, sort=False):
+    '''
+    Number the groups of the key columns of deliveries. The codes of each column are combined
+    into a single integer key, which is factorized. The groups are in the order in which they
+    first appear, like a groupby with sort=False, or sorted by the keys if sort is True.
+    Returns the code of each delivery and the position of the first delivery of each group
+    '''
+    key = np.zeros(len(df), dtype='int64')
+    for col in keys:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            # The codes of the categories are used as they are, in the order of the categories
+            colCodes = df[col].cat.codes.values.astype('int64')
+            size = len(df[col].cat.categories)
+        else:
+            colCodes, uniques = pd.factorize(df[col], sort=sort)
+            size = len(uniques)
+        # Missing values have the code -1
+        key = key * (size + 1) + colCodes
+    codes, groups = pd.factorize(key)
+
+    # The codes are in the order in which the groups appear, so a group starts at a delivery 
+    # whose code is larger than all the codes before it
+    seen = np.maximum.accumulate(codes)
+    first = np.flatnonzero(np.concatenate(([True], seen[1:] > seen[:-1])))[:len(groups)]
+    if sort:
+        order = np.argsort(groups, kind='stable')
+        rank = np.empty(len(groups), dtype='int64')
+        rank[order] = np.arange(len(groups))
+        codes = rank[codes]
+        first = first[order]
+    return(codes, first)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: groupCount
+# This function counts the deliveries of each group
+#
+
+###########################################################################################
+def groupCount(codes, n):
+    return(np.bincount(codes, minlength=n).astype('int64'))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: groupSum
+# This function sums the values of the deliveries of each group
+#
+
+###########################################################################################
+def groupSum(codes, values, n):
+    '''
+    Sum the values of the deliveries of each of the n groups with np.bincount. The sums of
+    integer and boolean values are returned as int64, and are exact as the weights of bincount
+    are doubles
+    '''
+    values = np.asarray(values)
+    sums = np.bincount(codes, weights=values.astype('float64'), minlength=n)
+    if values.dtype.kind in 'biu':
+        return(sums.astype('int64'))
+    return(sums)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: aggregate
+# This function computes the counts and sums of the groups of deliveries
+#
+
+###########################################################################################
+def aggregate(df, keys, sums, count=None, sort=False):
+    '''
+    Aggregate deliveries by the key columns
+    
+    Description
+    
+    This function computes the sums of columns, and optionally the number of deliveries, for
+    each group of the key columns. It gives the same result as
+    df.groupby(keys,sort=sort,observed=True,dropna=False).agg(...) but the keys are 
+    factorized once and the sums are computed with np.bincount. Deliveries with a missing key 
+    are a group of their own
+    
+    Usage
+    
+    aggregate(df, keys, sums, count=None, sort=False)
+    Arguments
+    
+    df	
+    The deliveries
+    keys	
+    The list of key columns e.g. ['batsman'] or ['match_id','team','bowler']
+    sums	
+    The dictionary of the columns of the result and the column of df, or array of values of
+    the deliveries, which is summed e.g. {'runsScored': 'runs'}
+    count	
+    The column of the result with the number of deliveries of each group. Not computed if None
+    sort	
+    If True the groups are sorted by the keys, else they are in the order in which they appear
+    Value
+    
+    result The data frame of the keys and the sums of each group
+    
+    See Also
+    
+    getGroupCodes
+    groupSum
+    Examples
+    
+    runs=aggregate(match,['batsman','bowler'],{'runs':'runs'},count='balls')
+    '''
+    codes, first = getGroupCodes(df, keys, sort)
+    n = len(first)
+    result = pd.DataFrame({col: df[col].values[first] for col in keys})
+    for name, values in sums.items():
+        if isinstance(values, str):
+            values = df[values].values
+        result[name] = groupSum(codes, values, n)
+    if count is not None:
+        result[count] = groupCount(codes, n)
+    return(result)
+    
@@ -8,40 +8,240 @@ import seaborn as sns
 import numpy as np
 from sklearn.linear_model import LinearRegression
 import glob
-import time
+import hashlib
+import zipfile
+import shutil
+import threading
+import uuid
+import concurrent.futures
+from itertools import repeat
+from yorkpy.aggregate import getGroupCodes, groupSum, aggregate
+
+# Use the libyaml based safe loader when PyYAML is built with libyaml. Else fall back to
+# the pure Python safe loader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# orjson is used to read Cricsheet json files if it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow is needed for the delivery store
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Name of the manifest of converted files kept in the target directory
+conversionManifest = 'yorkpy-manifest.json'
+
+# Zip archives opened by getArchive() in this process
+openArchives = {}
+archiveLock = threading.Lock()
+
+# File extension of each output format of the converted matches
+matchFormats = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}
+
+# Index of the matches in a delivery store, kept in the store directory
+deliveryStoreIndex = 'yorkpy-store.json'
+# Number of converted matches buffered before they are written to a delivery store
+storeBatchSize = 500
+
+# Catalog of the converted matches with one row per match, kept in the target directory
+matchCatalog = 'yorkpy-catalog.csv'
+catalogColumns = ['match_id', 'team1', 'team2', 'date', 'venue', 'city', 'competition', 'gender',
+                  'match_type', 'winner', 'tossWinner', 'tossDecision', 'file']
+# Files saved by yorkpy which are not converted matches
+catalogExcludedFiles = ['-allMatches', '-BattingDetails', '-BowlingDetails', '-BattingTotals',
+                        '-BowlingTotals', '-Dismissals']
+
+# Player-match tables with the batting and bowling details of all the teams, and the dismissals 
+# with their fielders, kept in the directory of the converted matches. The match ids in the 
+# tables, with the stamp of the converted file of each match, are in playerTablesIndex
+playerMatchTables = {'batting': 'yorkpy-BattingDetails.csv', 'bowling': 'yorkpy-BowlingDetails.csv',
+                     'dismissals': 'yorkpy-Dismissals.csv'}
+playerTablesIndex = 'yorkpy-details.json'
+# Running totals of each player and team in the player-match tables, kept with the tables. The
+# totals of the matches added or removed by an update are appended, and summed when loaded
+playerMatchTotals = {'batting': 'yorkpy-BattingTotals.csv', 'bowling': 'yorkpy-BowlingTotals.csv'}
+# Player-match tables and totals loaded by loadPlayerFile() in this process
+loadedPlayerTables = {}
+
+# Player, matches column and averaged columns of the batting and bowling rankings
+rankingColumns = {'batting': ('batsman', 'runs', ['runs', 'SR']),
+                  'bowling': ('bowler', 'wicket', ['wicket', 'econrate'])}
+
+# Teams of the leagues ranked by rankPlayers()
+leagueTeams = {
+    'IPL': ["Chennai Super Kings","Deccan Chargers","Delhi Daredevils",
+            "Kings XI Punjab", 'Kochi Tuskers Kerala',"Kolkata Knight Riders",
+            "Mumbai Indians", "Pune Warriors","Rajasthan Royals",
+            "Royal Challengers Bangalore","Sunrisers Hyderabad","Gujarat Lions",
+            "Rising Pune Supergiants"],
+    'Intl': ["India", "United States of America", "Canada", "United Arab Emirates",
+             "Afghanistan", "West Indies","Oman","Germany",
+             "Namibia","Sri Lanka","Singapore",
+             "Malaysia","South Africa","Netherlands",
+             "Zimbabwe","Pakistan","Scotland","Kuwait",
+             "New Zealand","Vanuatu","Papua New Guinea","Australia",
+             "Ireland","England","South Korea","Japan","Bangladesh",
+             "Nepal","Cayman Island","Rwanda","Qatar","Botswana",
+             "Uganda","Maldives","Fiji","Mozambique",
+             "Hong Kong","Denmark","Norway"],
+    'NTB': ["Derbyshire", "Durham", "Essex", "Glamorgan",
+            "Gloucestershire", "Hampshire", "Kent","Lancashire",
+            "Leicestershire", "Middlesex","Northamptonshire",
+            "Nottinghamshire","Somerset","Surrey","Sussex","Warwickshire",
+            "Worcestershire","Yorkshire"],
+    'BBL': ["Adelaide Strikers", "Brisbane Heat", "Hobart Hurricanes",
+            "Melbourne Renegades", "Perth Scorchers", "Sydney Sixers",
+            "Sydney Thunder"]}
+
+# Column types of the loaded matches. Names are categorical, runs and extras are small ints and
+# the delivery e.g. 12.3 is also split into the over (12) and the ball (3) of the over
+deliverySchema = {'match_id': 'category', 'delivery': 'float64', 'over': 'int8', 'ball': 'int8',
+                  'batsman': 'category', 'bowler': 'category', 'extras_dict': 'category',
+                  'non_striker': 'category',
+                  'runs_dict': 'category', 'wicket_dict': 'category', 'wides': 'int8',
+                  'noballs': 'int8', 'legbyes': 'int8', 'byes': 'int8', 'penalty': 'int8',
+                  'kind': 'category', 'player_out': 'category', 'fielders': 'category',
+                  'runs': 'int8', 'extras': 'int8', 'total': 'int8', 'team': 'category',
+                  'city': 'category', 'date': 'category', 'gender': 'category',
+                  'match_type': 'category', 'neutral_venue': 'int8', 'winner': 'category',
+                  'winType': 'category', 'winMargin': 'Int16', 'result': 'category',
+                  'resultHow': 'category', 'resultTeam': 'category', 'non_boundary': 'int8',
+                  'ManOfMatch': 'category', 'overs': 'int8', 'team1': 'category',
+                  'team2': 'category', 'tossWinner': 'category', 'tossDecision': 'category',
+                  'venue': 'category'}
+
+# Columns which can be missing e.g. the kind of wicket of a delivery without a wicket. The CSV
+# files have 0, or '0', for these. They are null in the loaded matches
+deliveryOptionalColumns = ['extras_dict', 'wicket_dict', 'kind', 'player_out', 'fielders', 'city',
+                           'winner', 'winType', 'winMargin', 'result', 'resultHow', 'resultTeam',
+                           'ManOfMatch']
+
+# Kinds of dismissal which are credited to the bowler
+bowlerWicketKinds = ['bowled', 'caught', 'caught and bowled', 'lbw', 'stumped', 'hit wicket']
+# Columns of the dismissal table of getDismissals(), after the match and team columns
+dismissalColumns = ['delivery', 'player_out', 'kind', 'bowler', 'fielder', 'substitute', 'fielders']
+
+# Columns of the converted matches read by getTeamBattingDetails() and getTeamBowlingDetails()
+battingDetailsColumns = ['batsman', 'runs', 'extras', 'total', 'non_boundary', 'wides', 'noballs',
+                         'legbyes', 'byes', 'penalty', 'team', 'bowler', 'fielders', 'kind',
+                         'player_out', 'date', 'team2', 'winner', 'result', 'venue']
+bowlingDetailsColumns = ['bowler', 'delivery', 'runs', 'wides', 'noballs', 'kind', 'player_out',
+                         'fielders', 'team', 'date', 'team2', 'winner', 'result', 'venue']
+# Columns of the converted matches read by buildAllTeamDetails()
+teamDetailsColumns = battingDetailsColumns + [col for col in bowlingDetailsColumns
+                                              if col not in battingDetailsColumns]
 
 ##########################################################################################
-# Designed and developed by Tinniam V Ganesh
-# Date : 27 Dec 2018
-# Function: convertYaml2PandasDataframeT20
-# This function converts yaml files to Pandas dataframe and saves as CSV
+# Date : 18 Oct 2026
+# Function: getYamlLoader
+# This function returns the name of the loader used to read yaml files
 #
 
 ###########################################################################################
-def convertYaml2PandasDataframeT20(infile,source,dest):
+def getYamlLoader():
     '''
-    Converts and save T20 yaml files to pandasdataframes
+    Returns the name of the yaml loader used by the converters. This is 'CSafeLoader' when 
+    PyYAML was built with libyaml and 'SafeLoader' otherwise
+    '''
+    return(YamlLoader.__name__)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getArchive
+# This function returns the open zip archive if the source is a zip file
+#
+
+###########################################################################################
+def getArchive(source):
+    '''
+    Return the zip archive for a source which is a zip file (e.g. ipl.zip from Cricsheet), or
+    None if the source is a directory. The archive is opened once in each process and reused,
+    so that the members can be read in a single pass without extracting them
+    '''
+    if not (os.path.isfile(source) and zipfile.is_zipfile(source)):
+        return(None)
+    path = os.path.abspath(source)
+    stat = os.stat(path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    # Worker processes must not share the file offset of an archive opened by the parent
+    key = (os.getpid(), path)
+    with archiveLock:
+        cached = openArchives.get(key)
+        if cached is not None and cached[0] == stamp:
+            return(cached[1])
+        if cached is not None:
+            cached[1].close()
+        archive = zipfile.ZipFile(path)
+        openArchives[key] = (stamp, archive)
+        return(archive)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: listMatchFiles
+# This function lists the match files in a directory or zip archive
+#
+
+###########################################################################################
+def listMatchFiles(source, extension):
+    archive = getArchive(source)
+    if archive is not None:
+        return([name for name in archive.namelist() if name.endswith(extension)])
+    return([file for file in os.listdir(source) if file.endswith(extension)])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: readMatchFile
+# This function reads the contents of a match file from a directory or zip archive
+#
+
+###########################################################################################
+def readMatchFile(infile, source):
+    archive = getArchive(source)
+    if archive is not None:
+        return(archive.read(infile))
+    # Open the file by its full path. The working directory is not changed so that conversions
+    # can run concurrently from threads
+    path=os.path.abspath(os.path.join(source,infile))
+    with open(path,'rb') as f:
+        return(f.read())
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: flattenInningsT20
+# This function flattens the deliveries of the innings into a dataframe
+#
+
+###########################################################################################
+def flattenInningsT20(innings):
+    '''
+    Flatten the deliveries of a T20 match into a single dataframe
     
     Description
     
-    This function coverts all T20 Yaml files from source directory to pandas ata frames. 
-    The data frames are then stored as .csv files The saved file is of the format 
-    team1-team2-date.csv For e.g. Kolkata Knight Riders-Sunrisers Hyderabad-2016-05-22.csv etc
+    This function walks the deliveries of the 1st and 2nd innings once and collects the 
+    fields of each delivery into plain column lists. The extras, runs and wicket dictionaries 
+    are split into their own columns as they are read, so the dataframe is built in one step.
+    Missing values are set as 0 
     
     Usage
     
-    convertYaml2PandasDataframeT20(yamlFile,sourceDir=".",targetDir=".")
+    flattenInningsT20(innings)
     Arguments
     
-    yamlFile	
-    The yaml file to be converted to dataframe and saved
-    sourceDir	
-    The source directory of the yaml file
-    targetDir	
-    The target directory in which the data frame is stored as RData file
+    innings	
+    The list of innings from the parsed yaml file
     Value
     
-    None
+    df The data frame with one row per delivery
     
     Note
     
@@ -62,172 +262,506 @@ def convertYaml2PandasDataframeT20(infile,source,dest):
     convertYaml2PandasDataframeT20
     Examples
     
-    # In the example below ../yamldir c
-    convertYaml2PandasDataframeT20("225171.yaml",".","../data")
+    df=flattenInningsT20(a['innings'])
     
     '''
+    cols=['delivery', 'batsman', 'bowler', 'extras_dict', 'non_striker',\
+           'runs_dict', 'wicket_dict', 'wides', 'noballs', 'legbyes', 'byes', 'penalty',\
+           'kind','player_out','fielders',\
+           'runs', 'extras', 'total', 'team']
+    extras=['wides','noballs','legbyes','byes','penalty']
+    wicket=['kind','player_out','fielders']
+    data={col:[] for col in cols}
+    
+    # Only the 1st and 2nd innings are included
+    for inning in innings[:2]:
+        for details in inning.values():
+            team=details['team']
+            for delivery in details['deliveries']:
+                for ball,d in delivery.items():
+                    data['delivery'].append(ball)
+                    data['batsman'].append(d['batsman'])
+                    data['bowler'].append(d['bowler'])
+                    data['non_striker'].append(d['non_striker'])
+                    data['team'].append(team)
+                    
+                    # Split extras dict into columns
+                    extrasDict=d.get('extras',0)
+                    data['extras_dict'].append(extrasDict)
+                    for col in extras:
+                        data[col].append(extrasDict.get(col,0) if extrasDict else 0)
+                    
+                    # Split runs dict into columns. 'batsman' in the runs dict are the runs scored by batsman
+                    runsDict=d['runs']
+                    data['runs_dict'].append(runsDict)
+                    data['runs'].append(runsDict.get('batsman',0))
+                    data['extras'].append(runsDict.get('extras',0))
+                    data['total'].append(runsDict.get('total',0))
+                    
+                    # Split wicket dict into columns
+                    wicketDict=d.get('wicket',0)
+                    data['wicket_dict'].append(wicketDict)
+                    for col in wicket:
+                        data[col].append(wicketDict.get(col,0) if wicketDict else 0)
+                        
+    df=pd.DataFrame(data,columns=cols)
+    return(df)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchExtension
+# This function returns the file extension of an output format
+#
+
+###########################################################################################
+def getMatchExtension(output_format):
+    if output_format not in matchFormats:
+        raise ValueError("Invalid output_format: " + str(output_format) + ". Must be one of " + ", ".join(matchFormats))
+    return(matchFormats[output_format])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: notMissing
+# This function checks which values of a column are present
+#
+
+###########################################################################################
+def notMissing(s):
+    '''
+    Returns True for the values of a column which are present. Missing values are null in the
+    loaded matches, and 0 or '0' in the CSV files of the converters
+    '''
+    return(s.notna() & (s != 0) & (s != '0'))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: applyDeliverySchema
+# This function sets the column types of the deliveries of matches
+#
 
-    os.chdir(source)
-    os.path.join(source,infile)
+###########################################################################################
+def applyDeliverySchema(df):
+    '''
+    Set the column types of the deliveries of matches
     
-    # Read Yaml file and convert to json
-    print('Converting file:',infile)
-    with open(infile) as f:
-           a=yaml.load(f)
-          
-    # 1st innings
-    deliveries=a['innings'][0]['1st innings']['deliveries']
-    
-    #Create empty dataframe for team1
-    team1=pd.DataFrame()
-    # Loop through all the deliveries of 1st innings and append each row to dataframe
-    for i in range(len(deliveries)):
-        df = pd.DataFrame(deliveries[i])
-        b= df.T
-        team1=pd.concat([team1,b])
-    
-    # Rename batsman to striker/non-striker as there is another column  batsman who scored runs
-    team1=team1.rename(columns={'batsman':'striker'}) 
-    # All extras column names
-    extras=[0,'wides','byes','legbyes','noballs','penalty']
-    
-    if 'extras' in team1: #Check if extras are there
-        # Get the columns in extras for team1
-        b=team1.extras.apply(pd.Series).columns
-        # Find the missing extras columns
-        diff= list(set(extras) - set(b))
-        print('Team1:diff:',diff)
-        
-        # Rename extras dict column as there is another column extras which comes from runs_dict
-        team1=team1.rename(columns={'extras':'extras_dict'}) 
-        #Create new columns by splitting dictionary columns - extras and runs
-        team1=pd.concat([team1,team1['extras_dict'].apply(pd.Series)], axis=1)
-        
-        # Add the missing columns
-        for col in diff:
-            print("team1:",col)
-            team1[col]=0
-            
-        team1=team1.drop(columns=0)
-    else:
-        print('Team1:Extras not present')
-        
-    # Rename runs columns to runs_dict
-    if 'runs' in team1: #Check if runs in team1
-        team1=team1.rename(columns={'runs':'runs_dict'}) 
-        team1=pd.concat([team1,team1['runs_dict'].apply(pd.Series)], axis=1)  
-    else:
-        print('Team1:Runs not present')
-        
-    if 'wicket' in team1: #Check if wicket present
-        # Rename wicket as wicket_dict dict column as there is another wicket column
-        team1=team1.rename(columns={'wicket':'wicket_dict'}) 
-        team1=pd.concat([team1,team1['wicket_dict'].apply(pd.Series)], axis=1) 
-    else:
-        print('Team1: Wicket not present')
-        
-    team1['team']=a['innings'][0]['1st innings']['team']
-    team1=team1.reset_index(inplace=False)
-    #Rename index to delivery
-    team1=team1.rename(columns={'index':'delivery'}) 
-    
-    
-
-    # 2nd innings - Check if the 2nd inning was played
-    if len(a['innings']) > 1: # Team2 played
-        deliveries=a['innings'][1]['2nd innings']['deliveries']
-        #Create empty dataframe for team1
-        team2=pd.DataFrame()
-        # Loop through all the deliveries of 1st innings
-        for i in range(len(deliveries)):
-            df = pd.DataFrame(deliveries[i])
-            b= df.T
-            team2=pd.concat([team2,b])
-            
-        # Rename batsman to striker/non-striker as there is another column  batsman who scored runs
-        team2=team2.rename(columns={'batsman':'striker'}) 
-            
-        # Get the columns in extras for team1
-        if 'extras' in team2: #Check if extras in team2
-            b=team2.extras.apply(pd.Series).columns
-            diff= list(set(extras) - set(b))
-            print('Team2:diff:',diff)
-            
-            # Rename extras dict column as there is another column extras which comes from runs_dict
-            team2=team2.rename(columns={'extras':'extras_dict'})
-            
-            #Create new columns by splitting dictionary columns - extras and runs
-            team2=pd.concat([team2,team2['extras_dict'].apply(pd.Series)], axis=1)
-            
-            # Add the missing columns
-            for col in diff:
-                print("team2:",col)
-                team2[col]=0
-                
-            team2=team2.drop(columns=0)
-        else:
-            print('Team2:Extras not present') 
-            
-        # Rename  runs columns to runs_dict  
-        if 'runs' in team2:
-            team2=team2.rename(columns={'runs':'runs_dict'})
-            team2=pd.concat([team2,team2['runs_dict'].apply(pd.Series)], axis=1) 
+    Description
+    
+    This function sets the column types in deliverySchema. The names of batsmen, bowlers, teams,
+    venues etc are categorical and runs and extras are small ints. The 0 or '0' of the optional
+    columns (kind, player_out, fielders, winner etc) are replaced with nulls. The over and the 
+    ball of the over are added from the delivery. Only the columns in the data frame are set,
+    so this can be used with matches loaded with a subset of the columns
+    
+    Usage
+    
+    applyDeliverySchema(df)
+    Arguments
+    
+    df	
+    The data frame of the deliveries of one or more matches
+    Value
+    
+    df The data frame with the column types of deliverySchema
+    
+    See Also
+    
+    loadMatch
+    notMissing
+    '''
+    df = df.copy(deep=False)
+    if 'delivery' in df.columns:
+        over = np.floor(df['delivery'].to_numpy(dtype='float64')).astype('int8')
+        # The balls of an over are numbered in order. A new over starts when the over or the
+        # batting team changes. The ball can not be taken from the delivery as 0.10 is 0.1
+        start = np.ones(len(over), dtype=bool)
+        start[1:] = over[1:] != over[:-1]
+        if 'team' in df.columns:
+            team = df['team'].to_numpy()
+            start[1:] |= team[1:] != team[:-1]
+        starts = np.flatnonzero(start)
+        ball = np.arange(len(over)) - np.repeat(starts, np.diff(np.append(starts, len(over)))) + 1
+        if 'over' in df.columns:
+            df['over'] = over
+            df['ball'] = ball.astype('int8')
         else:
-            print('Team2:Runs not present') 
-            
-        if 'wicket' in team2:
-            # Rename wicket as wicket_dict column as there is another column  wicket
-            team2=team2.rename(columns={'wicket':'wicket_dict'}) 
-            team2=pd.concat([team2,team2['wicket_dict'].apply(pd.Series)], axis=1) 
+            # The over and ball are placed after the delivery
+            position = df.columns.get_loc('delivery') + 1
+            df.insert(position, 'over', over)
+            df.insert(position + 1, 'ball', ball.astype('int8'))
+    for col, dtype in deliverySchema.items():
+        if col not in df.columns:
+            continue
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype) and dtype == 'category':
+            # Only the 0 of an optional column needs to be removed from a categorical column
+            if col in deliveryOptionalColumns and '0' in s.cat.categories:
+                df[col] = s.cat.remove_categories(['0'])
+            continue
+        if col in deliveryOptionalColumns:
+            s = s.where(notMissing(s))
+        if dtype == 'category':
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                s = s.cat.remove_unused_categories()
+            else:
+                # Dates read from yaml files are saved as text like in the CSV files
+                s = s.where(s.isna(), s.astype(str))
+        df[col] = s.astype(dtype)
+    return(df)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: concatMatches
+# This function combines the data frames of matches
+#
+
+###########################################################################################
+def concatMatches(frames):
+    '''
+    Combine the data frames of matches loaded with loadMatch(). The categories of the 
+    categorical columns are combined first, so that the columns stay categorical
+    '''
+    if len(frames) == 0:
+        return(pd.DataFrame())
+    for col in frames[0].columns:
+        if not all(col in frame.columns and isinstance(frame[col].dtype, pd.CategoricalDtype) for frame in frames):
+            continue
+        categories = frames[0][col].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[col].cat.categories)
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+    return(pd.concat(frames))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: combineDetails
+# This function combines the details of matches or teams
+#
+
+###########################################################################################
+def combineDetails(parts, by=None):
+    '''
+    Combine the details collected for each match or team into one data frame. The parts are 
+    concatenated and sorted once, instead of growing a data frame in a loop which copies it 
+    for every match
+    '''
+    if len(parts) == 0:
+        return(pd.DataFrame())
+    details = pd.concat(parts)
+    if by is not None:
+        # A stable sort keeps the order of the matches for rows with the same keys
+        details = details.sort_values(by, kind='mergesort')
+    return(details)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchWinners
+# This function gets the date and winner of the deliveries of matches
+#
+
+###########################################################################################
+def getMatchWinners(matches):
+    '''
+    Get the date and winner of the deliveries of matches. The winner is 'Tie' for matches 
+    which were tied or had no result
+    '''
+    winner = matches['winner'].astype(object)
+    return(pd.DataFrame({'date': matches['date'].astype(object),
+                         'winner': winner.where(notMissing(winner), 'Tie')}))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchCatalogEntry
+# This function gets the catalog entry of a converted match
+#
+
+###########################################################################################
+def getMatchCatalogEntry(df, info, matchId, file):
+    '''
+    Get the catalog entry of a converted match from the match info columns of its deliveries.
+    The competition is taken from the info of the match. The info is None for files which were
+    converted before the catalog was kept, and the competition is then not known
+    '''
+    columns = [col for col in catalogColumns if col not in ('match_id', 'competition', 'file')]
+    first = df[columns].iloc[:1].astype(object)
+    first = first.where(notMissing(first), None)
+    entry = {col: (None if first[col].iloc[0] is None else str(first[col].iloc[0])) for col in columns}
+    competition = None
+    if info is not None:
+        competition = info.get('event', {}).get('name', info.get('competition'))
+    entry.update({'match_id': matchId, 'competition': competition, 'file': file})
+    return(entry)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadMatchCatalog
+# This function loads the catalog of the converted matches in a directory
+#
+
+###########################################################################################
+def loadMatchCatalog(dir):
+    '''
+    Load the catalog of the converted matches in a directory as a dict keyed by match id. An 
+    empty catalog is returned if the directory does not have one
+    '''
+    path = os.path.join(dir, matchCatalog)
+    if not os.path.exists(path):
+        return({})
+    catalog = pd.read_csv(path, dtype=str)
+    catalog = catalog.astype(object).where(catalog.notna(), None)
+    return({entry['match_id']: entry for entry in catalog.to_dict('records')})
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: updateMatchCatalog
+# This function adds or replaces a match in the catalog
+#
+
+###########################################################################################
+def updateMatchCatalog(catalog, entry):
+    # The entry is moved to the end, so that the latest match saved to a file is kept
+    catalog.pop(entry['match_id'], None)
+    catalog[entry['match_id']] = entry
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchCatalogFrame
+# This function gets the catalog as a data frame
+#
+
+###########################################################################################
+def getMatchCatalogFrame(catalog):
+    df = pd.DataFrame(list(catalog.values()), columns=catalogColumns)
+    # A match with the same teams and date as an earlier match is saved to the same file. 
+    # Only the latest of these is in the file. A match converted again in another format has
+    # a file with the same name and another extension, and only the latest file is kept. The 
+    # matches in the delivery store all have the store index as the file
+    inStore = df['file'] == deliveryStoreIndex
+    names = df['file'].map(lambda file: os.path.splitext(file)[0])
+    df = pd.concat([df[inStore], df[~inStore][~names[~inStore].duplicated(keep='last')]])
+    return(df.sort_values(['date', 'match_id']).reset_index(drop=True))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveMatchCatalog
+# This function saves the catalog of the converted matches in a directory
+#
+
+###########################################################################################
+def saveMatchCatalog(dir, catalog):
+    path = os.path.join(dir, matchCatalog)
+    # Write to a temporary file and then replace, so that the catalog is never left half written
+    tmp = path + '.tmp'
+    getMatchCatalogFrame(catalog).to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchCatalog
+# This function gets the catalog of the converted matches in a directory
+#
+
+###########################################################################################
+def getMatchCatalog(dir):
+    '''
+    Get the catalog of the converted matches in a directory
+    
+    Description
+    
+    This function returns the catalog of the converted matches with one row per match. The
+    catalog is kept in the directory by the converters. Converted files which are not in the
+    catalog, e.g. files converted with an earlier version of yorkpy, are added by reading their 
+    first row, and the matches whose files have been removed are dropped. A file of a match 
+    which is in the catalog in another format is not added again. The catalog is saved if it 
+    has changed
+    
+    Usage
+    
+    getMatchCatalog(dir)
+    Arguments
+    
+    dir	
+    The directory of the converted matches or the delivery store
+    Value
+    
+    catalog The data frame with the match_id, team1, team2, date, venue, city, competition, 
+    gender, match_type, winner, tossWinner, tossDecision and file of each match
+    
+    See Also
+    
+    findTeamMatches
+    loadCatalogMatches
+    Examples
+    
+    catalog=getMatchCatalog("../data")
+    catalog[catalog.venue=='Eden Gardens']
+    '''
+    catalog = loadMatchCatalog(dir)
+    files = [file for file in os.listdir(dir) if file.endswith(tuple(matchFormats.values()))
+             and file != matchCatalog and not any(name in file for name in catalogExcludedFiles)]
+    present = set(files)
+    changed = False
+    # Drop the matches whose files have been removed
+    for matchId in [matchId for matchId, entry in catalog.items()
+                    if entry['file'] != deliveryStoreIndex and entry['file'] not in present]:
+        del catalog[matchId]
+        changed = True
+
+    # Add the converted files which are not in the catalog. The files of a match are named 
+    # team1-team2-date in every format, so a file with the name of a match in the catalog, 
+    # e.g. the csv file of a match which was converted again as parquet, is not added
+    known = set(os.path.splitext(entry['file'])[0] for entry in catalog.values())
+    # The match id is the name of the match file the converted file was made from, if it is 
+    # in the manifest of the directory
+    matchIds = {os.path.splitext(entry['outfile'])[0]: getMatchId(file)
+                for file, entry in loadConversionManifest(dir).items()}
+    # The parquet or feather file of a match is added rather than its csv file
+    for file in sorted(files, key=lambda file: (os.path.splitext(file)[0], file.endswith(matchFormats['csv']))):
+        name = os.path.splitext(file)[0]
+        if name in known:
+            continue
+        path = os.path.join(dir, file)
+        try:
+            if file.endswith(matchFormats['csv']):
+                df = pd.read_csv(path, nrows=1)
+            else:
+                df = loadMatch(path)
+            entry = getMatchCatalogEntry(df, None, matchIds.get(name, name), file)
+        except Exception as error:
+            print("Not a converted match:", file, "-", error)
+            continue
+        updateMatchCatalog(catalog, entry)
+        known.add(name)
+        changed = True
+    if changed:
+        saveMatchCatalog(dir, catalog)
+    return(getMatchCatalogFrame(catalog))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: findTeamMatches
+# This function finds the matches of a team or between 2 teams in the catalog
+#
+
+###########################################################################################
+def findTeamMatches(dir, team1, team2=None):
+    '''
+    Find the matches played by team1, or the matches between team1 and team2, in the catalog 
+    of a directory. The teams are compared for equality, so that 'India' does not match 
+    'West Indies'
+    '''
+    catalog = getMatchCatalog(dir)
+    if team2 is None:
+        return(catalog[(catalog.team1 == team1) | (catalog.team2 == team1)])
+    return(catalog[((catalog.team1 == team1) & (catalog.team2 == team2)) |
+                   ((catalog.team1 == team2) & (catalog.team2 == team1))])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadCatalogMatches
+# This function loads the matches of the catalog
+#
+
+###########################################################################################
+def loadCatalogMatches(dir, matches, columns=None):
+    '''
+    Load the matches found with findTeamMatches() or getMatchCatalog() one at a time. The 
+    matches are loaded from their converted files, or from the delivery store of the directory
+    '''
+    index = None
+    for match in matches.to_dict('records'):
+        if match['file'] == deliveryStoreIndex:
+            if index is None:
+                index = loadDeliveryStoreIndex(dir)
+            yield readDeliveryStoreMatches(dir, index, [match['match_id']], columns)
         else:
-            print('Team2:wicket not present')
+            yield loadMatch(os.path.join(dir, match['file']), columns)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadMatch
+# This function loads a converted match
+#
+
+###########################################################################################
+def loadMatch(file, columns=None):
+    '''
+    Load a converted match
     
-            
-        team2['team']=a['innings'][1]['2nd innings']['team'] 
-        team2=team2.reset_index(inplace=False)
-        
-        #Rename index to delivery
-        team2=team2.rename(columns={'index':'delivery'}) 
-    else: # Create empty columns for team2 so that the complete DF as all columns
-        team2 = pd.DataFrame()
-        cols=['delivery', 'striker', 'bowler', 'extras_dict', 'non_striker',\
-           'runs_dict', 'wicket_dict', 'wides', 'noballs', 'legbyes', 'byes', 'penalty',\
-            'kind','player_out','fielders',\
-           'batsman', 'extras', 'total', 'team']
-        team2 = team2.reindex(columns=cols)
+    Description
     
-    #Check for missing columns. It is possible that no wickets for lost in the entire innings
-    cols=['delivery', 'striker', 'bowler', 'extras_dict', 'non_striker',\
-           'runs_dict', 'wicket_dict', 'wides', 'noballs', 'legbyes', 'byes', 'penalty',\
-           'kind','player_out','fielders',\
-           'batsman', 'extras', 'total', 'team']
+    This function loads a match saved by the converters. The format (csv, parquet or feather)
+    is detected from the file extension. If columns are given only these columns are read.
+    The columns have the types in deliverySchema, with nulls for the missing values
     
-    # Team1 - missing columns
-    msngCols=list(set(cols) - set(team1.columns))
-    print('Team1-missing columns:', msngCols)
-    for col in msngCols:
-        print("Adding:team1:",col)
-        team1[col]=0
+    Usage
     
-    # Team2 - missing columns
-    msngCols=list(set(cols) - set(team2.columns))
-    print('Team2-missing columns:', msngCols)
-    for col in msngCols:
-        print("Adding:team2:",col)
-        team2[col]=0
+    loadMatch(file, columns=None)
+    Arguments
     
+    file	
+    The converted match
+    columns	
+    The list of columns to read. All columns are read if None
+    Value
     
-    # Now both team1 and team2 should have the same columns. Concatenate 
-    team1=team1[['delivery', 'striker', 'bowler', 'extras_dict', 'non_striker',\
-           'runs_dict', 'wicket_dict', 'wides', 'noballs', 'legbyes', 'byes', 'penalty',\
-           'kind','player_out','fielders',\
-           'batsman', 'extras', 'total', 'team']]
-    team2=team2[['delivery', 'striker', 'bowler', 'extras_dict', 'non_striker',\
-           'runs_dict', 'wicket_dict', 'wides', 'noballs', 'legbyes', 'byes', 'penalty',\
-           'kind','player_out','fielders',\
-           'batsman', 'extras', 'total', 'team']]
-    df=pd.concat([team1,team2])
+    match The data frame of the match
+    
+    See Also
+    
+    convertYaml2PandasDataframeT20
+    getAllMatchesBetweenTeams
+    '''
+    if file.endswith(matchFormats['parquet']):
+        match = pd.read_parquet(file, columns=columns)
+    elif file.endswith(matchFormats['feather']):
+        match = pd.read_feather(file, columns=columns)
+    else:
+        # The names are parsed as categorical columns and the 0 of the optional columns as null
+        categories = {col: dtype for col, dtype in deliverySchema.items() if dtype == 'category'}
+        missing = {col: ['0'] for col in deliveryOptionalColumns}
+        match = pd.read_csv(file, usecols=columns, dtype=categories, na_values=missing)
+    return(applyDeliverySchema(match))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveMatchT20
+# This function adds the match info to the deliveries and saves as CSV
+#
+
+###########################################################################################
+def saveMatchT20(df,a,dest,output_format='csv'):
+    '''
+    Add the match info to the deliveries of a match and save as CSV
     
+    Description
+    
+    This function adds the match info (city, date, winner, toss, venue etc) as columns to the 
+    flattened deliveries of a match and saves the data frame as a CSV file of the format 
+    team1-team2-date.csv. It is used by both the yaml and json converters. The match can also
+    be saved as parquet or feather with the column types in deliverySchema. With 'store' the 
+    match is not saved and the deliveries are returned to be added to a delivery store
+    
+    Usage
+    
+    saveMatchT20(df,a,dest,output_format='csv')
+    Arguments
+    
+    df	
+    The data frame of deliveries obtained with flattenInningsT20() or flattenJsonInningsT20()
+    a	
+    The parsed match with the 'info' of the match
+    dest	
+    The target directory in which the data frame is stored
+    output_format	
+    The format of the saved file - 'csv', 'parquet', 'feather' or 'store'
+    Value
+    
+    df, outfile The data frame and the name of the saved file
+    '''
+    if output_format != 'store':
+        extension=getMatchExtension(output_format)
+
     #Fill NA's with 0s
     df=df.fillna(0)
     
@@ -305,82 +839,954 @@ def convertYaml2PandasDataframeT20(infile,source,dest):
     df['tossDecision']=a['info']['toss']['decision']
     df['venue']=a['info']['venue']
     
-    # Rename column 'striker' to batsman
-    # Rename column 'batsman' to runs as it signifies runs scored by batsman
-    df=df.rename(columns={'batsman':'runs'})
-    df=df.rename(columns={'striker':'batsman'}) 
+    if output_format == 'store':
+        return applyDeliverySchema(df.reset_index(drop=True)), None
     if (type(a['info']['dates'][0]) == str):
-       outfile=a['info']['teams'][0]+ '-' + a['info']['teams'][1] + '-' +a['info']['dates'][0] + '.csv'
+       outfile=a['info']['teams'][0]+ '-' + a['info']['teams'][1] + '-' +a['info']['dates'][0] + extension
     else:  
-        outfile=a['info']['teams'][0]+ '-' + a['info']['teams'][1] + '-' +a['info']['dates'][0].strftime('%Y-%m-%d') + '.csv'
+        outfile=a['info']['teams'][0]+ '-' + a['info']['teams'][1] + '-' +a['info']['dates'][0].strftime('%Y-%m-%d') + extension
     destFile=os.path.join(dest,outfile)
     print(destFile)
-    df.to_csv(destFile,index=False)
+    if output_format == 'parquet':
+        applyDeliverySchema(df.reset_index(drop=True)).to_parquet(destFile,index=False)
+    elif output_format == 'feather':
+        applyDeliverySchema(df.reset_index(drop=True)).to_feather(destFile)
+    else:
+        df.to_csv(destFile,index=False)
     print("Dataframe shape=",df.shape)
     return df, outfile
 
 ##########################################################################################
-# Designed and developed by Tinniam V Ganesh
-# Date : 27 Dec 2018
-# Function: convertAllYaml2PandasDataframesT20
-# This function converts all yaml files to Pandas dataframes and saves as CSV
+# Designed and developed by Tinniam V Ganesh
+# Date : 27 Dec 2018
+# Function: convertYaml2PandasDataframeT20
+# This function converts yaml files to Pandas dataframe and saves as CSV
+#
+
+###########################################################################################
+def convertYaml2PandasDataframeT20(infile,source,dest,output_format='csv',catalogEntries=None):
+    '''
+    Converts and save T20 yaml files to pandasdataframes
+    
+    Description
+    
+    This function coverts all T20 Yaml files from source directory to pandas ata frames. 
+    The data frames are then stored as .csv files The saved file is of the format 
+    team1-team2-date.csv For e.g. Kolkata Knight Riders-Sunrisers Hyderabad-2016-05-22.csv etc
+    
+    Usage
+    
+    convertYaml2PandasDataframeT20(yamlFile,sourceDir=".",targetDir=".",output_format="csv",catalogEntries=None)
+    Arguments
+    
+    yamlFile	
+    The yaml file to be converted to dataframe and saved
+    sourceDir	
+    The source directory of the yaml file. This can also be a zip archive of yaml files
+    targetDir	
+    The target directory in which the data frame is stored as RData file
+    output_format	
+    The format of the saved file - 'csv', 'parquet' or 'feather'. Parquet and feather files
+    keep the column types and are faster to load
+    catalogEntries	
+    If a list is given, the catalog entry of the match is appended to it. This is used by the
+    batch converters to keep the match catalog
+    Value
+    
+    None
+    
+    Note
+    
+    Maintainer: Tinniam V Ganesh tvganesh.85@gmail.com
+    
+    Author(s)
+    
+    Tinniam V Ganesh
+    
+    References
+    
+    http://cricsheet.org/
+    https://gigadom.in/
+
+    
+    See Also
+
+    convertYaml2PandasDataframeT20
+    Examples
+    
+    # In the example below ../yamldir c
+    convertYaml2PandasDataframeT20("225171.yaml",".","../data")
+    # Convert a match in a Cricsheet zip archive
+    convertYaml2PandasDataframeT20("335982.yaml","../ipl.zip","../data")
+    
+    '''
+
+    # Read Yaml file and convert to json
+    print('Converting file:',infile)
+    a=yaml.load(readMatchFile(infile,source),Loader=YamlLoader)
+          
+    # Flatten the deliveries of the 1st and 2nd innings into a single dataframe
+    df=flattenInningsT20(a['innings'])
+    
+    df, outfile = saveMatchT20(df, a, dest, output_format)
+    if catalogEntries is not None:
+        catalogEntries.append(getMatchCatalogEntry(df, a['info'], getMatchId(infile), outfile or deliveryStoreIndex))
+    return df, outfile
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getFileHash
+# This function computes the hash of the contents of a file
+#
+
+###########################################################################################
+def getFileHash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return(h.hexdigest())
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchFileStat
+# This function gets the size and modification time of a match file
+#
+
+###########################################################################################
+def getMatchFileStat(source, file):
+    archive = getArchive(source)
+    if archive is not None:
+        info = archive.getinfo(file)
+        return(info.file_size, '%04d-%02d-%02d %02d:%02d:%02d' % info.date_time)
+    stat = os.stat(os.path.join(source, file))
+    return(stat.st_size, stat.st_mtime_ns)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchFileHash
+# This function gets the hash of the contents of a match file
+#
+
+###########################################################################################
+def getMatchFileHash(source, file):
+    archive = getArchive(source)
+    if archive is not None:
+        # The CRC of a zip member is kept in the archive directory, so the member is not read
+        return('crc32:%08x' % archive.getinfo(file).CRC)
+    return(getFileHash(os.path.join(source, file)))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadConversionManifest
+# This function loads the manifest of converted files from the target directory
+#
+
+###########################################################################################
+def loadConversionManifest(dest):
+    '''
+    Load the manifest of converted files. The manifest maps each match file to its size,
+    mtime, hash and the CSV file it was converted to. An empty manifest is returned if
+    the target directory does not have one
+    '''
+    path = os.path.join(dest, conversionManifest)
+    if not os.path.exists(path):
+        return({})
+    with open(path) as f:
+        return(json.load(f))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveConversionManifest
+# This function saves the manifest of converted files in the target directory
+#
+
+###########################################################################################
+def saveConversionManifest(dest, manifest):
+    path = os.path.join(dest, conversionManifest)
+    # Write to a temporary file and then replace, so that the manifest is never left half written
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: removeStaleOutput
+# This function removes a converted CSV file which is no longer in the manifest
+#
+
+###########################################################################################
+def removeStaleOutput(dest, manifest, outfile):
+    # Another match file may have been converted to the same CSV file
+    if any(entry['outfile'] == outfile for entry in manifest.values()):
+        return
+    path = os.path.join(dest, outfile)
+    if os.path.exists(path):
+        print("Removing:", path)
+        os.remove(path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getChangedMatchFiles
+# This function gets the match files which are new or have changed since the last conversion
+#
+
+###########################################################################################
+def getChangedMatchFiles(source, dest, files, manifest, extension):
+    '''
+    Get the match files which need to be converted
+    
+    Description
+    
+    This function compares the match files in the source directory with the manifest. Files whose
+    size and mtime are the same as in the manifest are skipped without being read. Otherwise the
+    file is hashed and is converted only if the contents have changed. Files which are no longer
+    in the source directory are removed from the manifest along with their CSV files
+    
+    Usage
+    
+    getChangedMatchFiles(source, dest, files, manifest, extension)
+    Arguments
+    
+    source	
+    The source directory or zip archive of the match files
+    dest	
+    The target directory of the CSV files
+    files	
+    The match files in the source directory
+    manifest	
+    The manifest obtained with loadConversionManifest()
+    extension	
+    The extension of the match files e.g. '.yaml'. Only the files in the manifest with this
+    extension are checked for removal
+    Value
+    
+    changed The list of files to convert
+    entries The size, mtime and hash of the files to convert
+    '''
+    changed = []
+    entries = {}
+    for file in files:
+        size, mtime = getMatchFileStat(source, file)
+        entry = manifest.get(file)
+        converted = entry is not None and os.path.exists(os.path.join(dest, entry['outfile']))
+        if converted and entry['size'] == size and entry['mtime'] == mtime:
+            continue
+
+        fileHash = getMatchFileHash(source, file)
+        if converted and entry['hash'] == fileHash:
+            # The file was touched but the contents are the same
+            entry['size'] = size
+            entry['mtime'] = mtime
+            continue
+        entries[file] = {'size': size, 'mtime': mtime, 'hash': fileHash}
+        changed.append(file)
+
+    # Remove the CSV files of match files which have disappeared from the source
+    present = set(files)
+    for file in [file for file in manifest if file.endswith(extension) and file not in present]:
+        outfile = manifest.pop(file)['outfile']
+        removeStaleOutput(dest, manifest, outfile)
+    return(changed, entries)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: updateConversionManifest
+# This function records a converted file in the manifest
+#
+
+###########################################################################################
+def updateConversionManifest(dest, manifest, file, entry, outfile):
+    old = manifest.get(file)
+    manifest[file] = dict(entry, outfile=outfile)
+    # The teams or date of a changed file may give a different CSV file name
+    if old is not None and old['outfile'] != outfile:
+        removeStaleOutput(dest, manifest, old['outfile'])
+
+##########################################################################################
+# Designed and developed by Tinniam V Ganesh
+# Date : 27 Dec 2018
+# Function: convertAllYaml2PandasDataframesT20
+# This function converts all yaml files to Pandas dataframes and saves as CSV
+#
+
+###########################################################################################
+def convertAllYaml2PandasDataframesT20(source,dest,workers=1,chunksize=8,incremental=False,output_format='csv'):
+    '''
+    Convert and save all Yaml files to pandas dataframes and save as CSV
+    
+    Description
+    
+    This function coverts all Yaml files from source directory to data frames. The data frames are 
+    then stored as .csv. The saved files are of the format team1-team2-date.RData For 
+    e.g. England-India-2008-04-06.RData etc
+    
+    Usage
+    
+    convertAllYaml2PandasDataframesT20(sourceDir=".",targetDir=".",workers=1,chunksize=8,incremental=False,output_format="csv")
+    Arguments
+    
+    sourceDir	
+    The source directory of the yaml files. This can also be a zip archive of yaml files
+    e.g. ipl.zip from Cricsheet. The files are then read from the archive without extracting it
+    targetDir	
+    The target directory in which the data frames are stored as RData files
+    workers	
+    The number of worker processes. If workers > 1 the files are converted in a process pool.
+    Files which fail to convert are reported and the rest of the batch continues
+    chunksize	
+    The number of files handed to a worker process at a time when workers > 1
+    incremental	
+    If incremental=True a manifest of the converted files is kept in the target directory. 
+    Only new or changed yaml files are converted, and the CSV files of yaml files which no 
+    longer exist in the source directory are removed
+    output_format	
+    The format of the saved files - 'csv', 'parquet' or 'feather'. With 'store' all matches are
+    added to a single delivery store in the target directory, keyed by the match id (the name
+    of the yaml file). See loadDeliveryStore(). With incremental=True the matches already in 
+    the store are skipped
+    Value
+    
+    failed The list of (file, error) for the files which failed to convert. The other files are 
+    converted
+    
+    Note
+    
+    Maintainer: Tinniam V Ganesh tvganesh.85@gmail.com
+    
+    Author(s)
+    
+    Tinniam V Ganesh
+    
+    References
+    
+    http://cricsheet.org/
+    https://gigadom.in/
+
+    
+    See Also
+
+    convertYaml2PandasDataframe
+    Examples
+
+    # In the example below ../yamldir is the source dir for the yaml files
+    convertAllYaml2PandasDataframesT20("../yamldir","../data")
+    # Convert only the new matches of the latest Cricsheet download
+    convertAllYaml2PandasDataframesT20("../yamldir","../data",incremental=True)
+    # Convert the matches in a Cricsheet zip archive
+    convertAllYaml2PandasDataframesT20("../ipl.zip","../data",workers=4)
+    # Save the matches as parquet
+    convertAllYaml2PandasDataframesT20("../yamldir","../data",output_format="parquet")
+    # Add the matches to a delivery store
+    convertAllYaml2PandasDataframesT20("../ipl.zip","../store",output_format="store")
+    
+    
+    '''
+    print("Yaml loader:", getYamlLoader())
+    return(convertAllMatchFilesT20(convertYaml2PandasDataframeT20, ".yaml", source, dest,
+                                   workers=workers, chunksize=chunksize, incremental=incremental,
+                                   output_format=output_format))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: convertAllMatchFilesT20
+# This function converts all match files of a format with the given converter
+#
+
+###########################################################################################
+def convertAllMatchFilesT20(convert,extension,source,dest,workers=1,chunksize=8,incremental=False,output_format='csv'):
+    '''
+    Convert all match files in the source directory with a converter. This is used by
+    convertAllYaml2PandasDataframesT20() and convertAllJson2PandasDataframesT20(). See
+    convertAllYaml2PandasDataframesT20() for the workers, chunksize, incremental and
+    output_format options
+    '''
+    if output_format == 'store':
+        return(saveMatchFilesToStoreT20(convert, extension, source, dest, workers, chunksize, incremental))
+    # Check the output format before converting any file
+    getMatchExtension(output_format)
+    os.makedirs(dest, exist_ok=True)
+    files = listMatchFiles(source, extension)
+    catalog = loadMatchCatalog(dest)
+    if incremental:
+        # Only convert files which are new or have changed since the last run
+        manifest = loadConversionManifest(dest)
+        files, entries = getChangedMatchFiles(source, dest, files, manifest, extension)
+        print("Files to convert=", len(files))
+
+    failed = []
+    executor = None
+    try:
+        # A file which fails to convert is reported and the other files are converted, with 
+        # or without workers
+        if workers > 1:
+            # Files are handed to the workers in chunks and the results come back in order
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(convertMatchFileT20, repeat(convert), files, repeat(source), repeat(dest),
+                                   repeat(output_format), chunksize=chunksize)
+        else:
+            results = map(convertMatchFileT20, repeat(convert), files, repeat(source), repeat(dest),
+                          repeat(output_format))
+        for index, (file, outfile, error, entry) in enumerate(results):
+            if error is None:
+                print("Converted file", index+1, "of", len(files), ":", file, "->", outfile)
+                updateMatchCatalog(catalog, entry)
+                if incremental:
+                    updateConversionManifest(dest, manifest, file, entries[file], outfile)
+            else:
+                print("Failed file", index+1, "of", len(files), ":", file, "-", error)
+                failed.append((file, error))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        # Save the files converted so far even if the run was interrupted. An error in saving 
+        # is reported, and does not replace the failed files or the error of the run
+        try:
+            if incremental:
+                saveConversionManifest(dest, manifest)
+            saveMatchCatalog(dest, catalog)
+        except Exception as error:
+            print("Could not save the catalog of", dest, "-", type(error).__name__ + ": " + str(error))
+    print("Converted", len(files) - len(failed), "files. Failed", len(failed), "files")
+    # The rankings of the directory are brought up to date with the converted matches
+    updateConvertedPlayerTables(dest)
+    return(failed)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: updateConvertedPlayerTables
+# This function updates the player-match tables of a directory after a conversion
+#
+
+###########################################################################################
+def updateConvertedPlayerTables(dir):
+    '''
+    Update the player-match tables of a directory with the matches which were just converted.
+    The tables are only updated if the directory has them, so that a conversion does not build
+    the tables of a directory whose players are never ranked. An error in the update is 
+    reported, and the tables are then brought up to date by the next ranking
+    '''
+    if loadPlayerTablesIndex(dir) is None:
+        return
+    try:
+        updatePlayerMatchTables(dir)
+    except Exception as error:
+        print("Could not update the player-match tables of", dir, "-", type(error).__name__ + ": " + str(error))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchId
+# This function gets the match id of a match file
+#
+
+###########################################################################################
+def getMatchId(file):
+    '''
+    Returns the match id of a Cricsheet match file, which is the name of the file without the
+    extension e.g. 335982 for 335982.yaml or json/335982.json in a zip archive
+    '''
+    return(os.path.splitext(os.path.basename(file))[0])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadDeliveryStoreIndex
+# This function loads the index of the matches in a delivery store
+#
+
+###########################################################################################
+def loadDeliveryStoreIndex(store):
+    '''
+    Load the index of a delivery store. The index maps each match id to the part file and
+    the row group of the part file which has the deliveries of the match. An empty index is
+    returned if the store does not have one
+    '''
+    path = os.path.join(store, deliveryStoreIndex)
+    if not os.path.exists(path):
+        return({})
+    with open(path) as f:
+        return(json.load(f))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveDeliveryStoreIndex
+# This function saves the index of the matches in a delivery store
+#
+
+###########################################################################################
+def saveDeliveryStoreIndex(store, index):
+    path = os.path.join(store, deliveryStoreIndex)
+    # Write to a temporary file and then replace, so that the index is never left half written
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: writeDeliveryStorePart
+# This function writes matches to a new part file of a delivery store
+#
+
+###########################################################################################
+def writeDeliveryStorePart(store, index, matches):
+    '''
+    Write matches to new part files of a delivery store. The part files are partitioned by
+    season e.g. season=2017/part-<id>.parquet. Each match is one row group of the part file,
+    so that a match can be read without reading the other matches. A match which is already
+    in the store is replaced, as the index then points to the new row group. The old row group
+    is removed by compactDeliveryStore()
+    '''
+    types = {'float64': pa.float64(), 'int8': pa.int8(), 'Int16': pa.int16(), 'category': pa.string()}
+    schema = pa.schema([(col, types[dtype]) for col, dtype in deliverySchema.items()])
+    seasons = {}
+    for matchId, df in matches:
+        seasons.setdefault(str(df['date'].iloc[0])[:4], []).append((matchId, df))
+    for season, seasonMatches in seasons.items():
+        part = 'season=' + season + '/part-' + uuid.uuid4().hex + '.parquet'
+        path = os.path.join(store, part)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with pq.ParquetWriter(path, schema) as writer:
+            for rowGroup, (matchId, df) in enumerate(seasonMatches):
+                df = df.assign(match_id=matchId)
+                # The categories of each match are different, so names are written as text
+                for col in df.columns:
+                    if isinstance(df[col].dtype, pd.CategoricalDtype):
+                        df[col] = df[col].astype(object)
+                writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+                index[matchId] = {'part': part, 'rowGroup': rowGroup}
+        print("Saved", len(seasonMatches), "matches to", path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveMatchFilesToStoreT20
+# This function converts all match files and appends them to a delivery store
+#
+
+###########################################################################################
+def saveMatchFilesToStoreT20(convert,extension,source,store,workers=1,chunksize=8,incremental=False):
+    '''
+    Convert all match files in the source directory and append them to a delivery store. This
+    is used by convertAllMatchFilesT20() when output_format='store'. The converted matches are
+    buffered and written storeBatchSize matches at a time. If incremental=True the matches 
+    which are already in the store are skipped
+    '''
+    if pa is None:
+        raise ImportError("pyarrow is needed for output_format='store'")
+    os.makedirs(store, exist_ok=True)
+    index = loadDeliveryStoreIndex(store)
+    catalog = loadMatchCatalog(store)
+    files = listMatchFiles(source, extension)
+    if incremental:
+        files = [file for file in files if getMatchId(file) not in index]
+        print("Files to convert=", len(files))
+
+    executor = None
+    pending = []
+    failed = []
+    try:
+        if workers > 1:
+            # Files are handed to the workers in chunks and the results come back in order
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(convertMatchFileT20, repeat(convert), files, repeat(source), repeat(store),
+                                   repeat('store'), chunksize=chunksize)
+        else:
+            results = map(convertMatchFileT20, repeat(convert), files, repeat(source), repeat(store),
+                          repeat('store'))
+        for count, (file, df, error, entry) in enumerate(results):
+            if error is None:
+                print("Converted file", count+1, "of", len(files), ":", file, "->", getMatchId(file))
+                pending.append((getMatchId(file), df))
+                updateMatchCatalog(catalog, entry)
+                if len(pending) >= storeBatchSize:
+                    writeDeliveryStorePart(store, index, pending)
+                    pending = []
+            else:
+                print("Failed file", count+1, "of", len(files), ":", file, "-", error)
+                failed.append((file, error))
+    finally:
+        # Save the matches converted so far even if the run was interrupted
+        if len(pending) != 0:
+            writeDeliveryStorePart(store, index, pending)
+        saveDeliveryStoreIndex(store, index)
+        saveMatchCatalog(store, catalog)
+        if executor is not None:
+            executor.shutdown()
+    compactDeliveryStore(store, index)
+    print("Converted", len(files) - len(failed), "files. Failed", len(failed), "files")
+    # The rankings of the store are brought up to date with the stored matches
+    updateConvertedPlayerTables(store)
+    return(failed)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: compactDeliveryStore
+# This function removes the matches of a delivery store which are no longer in its index
+#
+
+###########################################################################################
+def compactDeliveryStore(store, index):
+    '''
+    Remove the row groups of the part files of a delivery store which are not in the index,
+    i.e. the old row groups of matches which were stored again. A part file with no match in
+    the index is deleted. The matches of the index in a part file with old row groups are 
+    written to a new part file, and the old part file is deleted once the index is saved
+    '''
+    referenced = {}
+    for entry in index.values():
+        referenced.setdefault(entry['part'], set()).add(entry['rowGroup'])
+    stale = []
+    for path in glob.glob(os.path.join(store, 'season=*', 'part-*.parquet')):
+        part = os.path.relpath(path, store).replace(os.sep, '/')
+        if part not in referenced:
+            stale.append(path)
+        elif len(referenced[part]) < pq.ParquetFile(path).num_row_groups:
+            matchIds = [matchId for matchId, entry in index.items() if entry['part'] == part]
+            matches = readDeliveryStoreMatches(store, index, matchIds)
+            writeDeliveryStorePart(store, index, matches.groupby('match_id', sort=False, observed=True))
+            stale.append(path)
+    if len(stale) == 0:
+        return
+    # The index points to the new part files before the old ones are deleted
+    saveDeliveryStoreIndex(store, index)
+    for path in stale:
+        os.remove(path)
+    print("Removed", len(stale), "old part files from", store)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadDeliveryStore
+# This function loads matches from a delivery store
+#
+
+###########################################################################################
+def loadDeliveryStore(store, matchIds=None, columns=None):
+    '''
+    Load matches from a delivery store
+    
+    Description
+    
+    This function loads the deliveries of matches from a delivery store created with 
+    output_format='store'. Only the row groups of the given matches are read from the part
+    files, so the other matches in the store are not read. The columns have the types in
+    deliverySchema and the match_id column identifies the match of each delivery. The store 
+    should be read with this function rather than as a parquet dataset, since a part file of 
+    a conversion which was interrupted may still have old row groups of matches stored again
+    
+    Usage
+    
+    loadDeliveryStore(store, matchIds=None, columns=None)
+    Arguments
+    
+    store	
+    The directory of the delivery store
+    matchIds	
+    The list of match ids e.g. ['335982','335983']. All matches are loaded if None
+    columns	
+    The list of columns to read. All columns are read if None
+    Value
+    
+    matches The data frame of the deliveries of the matches
+    
+    See Also
+    
+    convertAllYaml2PandasDataframesT20
+    convertAllJson2PandasDataframesT20
+    Examples
+    
+    convertAllYaml2PandasDataframesT20("../ipl.zip","../store",output_format="store")
+    matches=loadDeliveryStore("../store",['335982','335983'])
+    '''
+    if pa is None:
+        raise ImportError("pyarrow is needed to load a delivery store")
+    index = loadDeliveryStoreIndex(store)
+    if matchIds is None:
+        matchIds = list(index)
+    return(readDeliveryStoreMatches(store, index, matchIds, columns))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: readDeliveryStoreMatches
+# This function reads matches from a delivery store with its index
+#
+
+###########################################################################################
+def readDeliveryStoreMatches(store, index, matchIds, columns=None):
+    if columns is not None and 'match_id' not in columns:
+        columns = ['match_id'] + list(columns)
+
+    # Get the row groups to read from each part file
+    parts = {}
+    for matchId in matchIds:
+        entry = index.get(str(matchId))
+        if entry is None:
+            print("Match not in store:", matchId)
+            continue
+        parts.setdefault(entry['part'], []).append(entry['rowGroup'])
+    frames = []
+    for part, rowGroups in parts.items():
+        table = pq.ParquetFile(os.path.join(store, part)).read_row_groups(sorted(rowGroups), columns=columns)
+        frames.append(applyDeliverySchema(table.to_pandas(strings_to_categorical=True)))
+    return(concatMatches(frames).reset_index(drop=True))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: convertMatchFileT20
+# This function converts a match file in a worker process
+#
+
+###########################################################################################
+def convertMatchFileT20(convert,infile,source,dest,output_format='csv'):
+    '''
+    Convert a match file for convertAllMatchFilesT20, in a worker process or in the calling 
+    process. Any error is returned instead of being raised, so that one bad file does not 
+    abort the batch
+    
+    Value
+    
+    (infile, outfile, error, entry) where error is None if the file was converted and entry is
+    the catalog entry of the match. With output_format='store' the deliveries are returned 
+    instead of outfile
+    '''
+    try:
+        catalogEntries = []
+        df, outfile = convert(infile, source, dest, output_format, catalogEntries)
+        if output_format == 'store':
+            return(infile, df, None, catalogEntries[0])
+        return(infile, outfile, None, catalogEntries[0])
+    except Exception as error:
+        return(infile, None, type(error).__name__ + ": " + str(error), None)
+
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: flattenJsonInningsT20
+# This function flattens the deliveries of the innings of a json match into a dataframe
+#
+
+###########################################################################################
+def flattenJsonInningsT20(innings):
+    '''
+    Flatten the deliveries of a T20 match in Cricsheet json format into a single dataframe
+    
+    Description
+    
+    This function walks the overs and deliveries of the 1st and 2nd innings of a match in the
+    Cricsheet json format and builds a data frame with the same columns as flattenInningsT20().
+    The delivery is numbered as over.ball as in the yaml format. The runs, extras and wicket of
+    each delivery are also kept as dicts in the yaml layout. Super overs are not included
+    
+    Usage
+    
+    flattenJsonInningsT20(innings)
+    Arguments
+    
+    innings	
+    The list of innings from the parsed json file
+    Value
+    
+    df The data frame with one row per delivery
+    
+    References
+    
+    http://cricsheet.org/
+    https://gigadom.in/
+    
+    
+    See Also
+    
+    flattenInningsT20
+    convertJson2PandasDataframeT20
+    Examples
+    
+    df=flattenJsonInningsT20(a['innings'])
+    
+    '''
+    cols=['delivery', 'batsman', 'bowler', 'extras_dict', 'non_striker',\
+           'runs_dict', 'wicket_dict', 'wides', 'noballs', 'legbyes', 'byes', 'penalty',\
+           'kind','player_out','fielders',\
+           'runs', 'extras', 'total', 'team']
+    extras=['wides','noballs','legbyes','byes','penalty']
+    data={col:[] for col in cols}
+
+    # Only the 1st and 2nd innings are included
+    innings=[inning for inning in innings if not inning.get('super_over',False)][:2]
+    for inning in innings:
+        team=inning['team']
+        for over in inning.get('overs',[]):
+            for ball,d in enumerate(over['deliveries'],start=1):
+                data['delivery'].append(float(str(over['over']) + '.' + str(ball)))
+                data['batsman'].append(d['batter'])
+                data['bowler'].append(d['bowler'])
+                data['non_striker'].append(d['non_striker'])
+                data['team'].append(team)
+
+                # Split extras dict into columns
+                extrasDict=d.get('extras',0)
+                data['extras_dict'].append(extrasDict)
+                for col in extras:
+                    data[col].append(extrasDict.get(col,0) if extrasDict else 0)
+
+                # Split runs dict into columns. 'batter' in the runs dict are the runs scored by batsman
+                runs=d['runs']
+                runsDict={'batsman':runs['batter'],'extras':runs['extras'],'total':runs['total']}
+                if 'non_boundary' in runs:
+                    runsDict['non_boundary']=runs['non_boundary']
+                data['runs_dict'].append(runsDict)
+                data['runs'].append(runs['batter'])
+                data['extras'].append(runs['extras'])
+                data['total'].append(runs['total'])
+
+                # Only the first wicket of a delivery is kept as in the yaml format. The fielders
+                # are kept as a list of names, with substitutes named sub (name) as in yaml
+                if 'wickets' in d:
+                    wicket=d['wickets'][0]
+                    fielders=[('sub (' + fielder['name'] + ')' if fielder.get('substitute') else fielder['name'])
+                              for fielder in wicket.get('fielders',[]) if 'name' in fielder]
+                    wicketDict={'kind':wicket['kind'],'player_out':wicket['player_out']}
+                    if fielders:
+                        wicketDict['fielders']=fielders
+                    data['wicket_dict'].append(wicketDict)
+                    data['kind'].append(wicket['kind'])
+                    data['player_out'].append(wicket['player_out'])
+                    data['fielders'].append(fielders if fielders else 0)
+                else:
+                    data['wicket_dict'].append(0)
+                    data['kind'].append(0)
+                    data['player_out'].append(0)
+                    data['fielders'].append(0)
+
+    df=pd.DataFrame(data,columns=cols)
+    return(df)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: convertJson2PandasDataframeT20
+# This function converts json files to Pandas dataframe and saves as CSV
+#
+
+###########################################################################################
+def convertJson2PandasDataframeT20(infile,source,dest,output_format='csv',catalogEntries=None):
+    '''
+    Converts and save T20 json files to pandasdataframes
+    
+    Description
+    
+    This function coverts a T20 match in the Cricsheet json format to a pandas data frame.
+    The data frame has the same columns as the data frame from convertYaml2PandasDataframeT20(),
+    so all the functions in yorkpy work on it. The data frame is stored as .csv file of the
+    format team1-team2-date.csv For e.g. Kolkata Knight Riders-Sunrisers Hyderabad-2016-05-22.csv etc.
+    orjson is used to parse the file if it is installed
+    
+    Usage
+    
+    convertJson2PandasDataframeT20(jsonFile,sourceDir=".",targetDir=".",output_format="csv",catalogEntries=None)
+    Arguments
+    
+    jsonFile	
+    The json file to be converted to dataframe and saved
+    sourceDir	
+    The source directory of the json file. This can also be a zip archive of json files
+    targetDir	
+    The target directory in which the data frame is stored
+    output_format	
+    The format of the saved file - 'csv', 'parquet' or 'feather'
+    catalogEntries	
+    If a list is given, the catalog entry of the match is appended to it
+    Value
+    
+    df, outfile The data frame and the name of the saved file
+    
+    References
+    
+    http://cricsheet.org/
+    https://gigadom.in/
+    
+    
+    See Also
+    
+    convertYaml2PandasDataframeT20
+    convertAllJson2PandasDataframesT20
+    Examples
+    
+    convertJson2PandasDataframeT20("1082591.json",".","../data")
+    
+    '''
+    print('Converting file:',infile)
+    if orjson is not None:
+        a=orjson.loads(readMatchFile(infile,source))
+    else:
+        a=json.loads(readMatchFile(infile,source))
+
+    # Flatten the deliveries of the 1st and 2nd innings into a single dataframe
+    df=flattenJsonInningsT20(a['innings'])
+    df, outfile = saveMatchT20(df, a, dest, output_format)
+    if catalogEntries is not None:
+        catalogEntries.append(getMatchCatalogEntry(df, a['info'], getMatchId(infile), outfile or deliveryStoreIndex))
+    return df, outfile
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: convertAllJson2PandasDataframesT20
+# This function converts all json files to Pandas dataframes and saves as CSV
 #
 
 ###########################################################################################
-def convertAllYaml2PandasDataframesT20(source,dest):
+def convertAllJson2PandasDataframesT20(source,dest,workers=1,chunksize=8,incremental=False,output_format='csv'):
     '''
-    Convert and save all Yaml files to pandas dataframes and save as CSV
+    Convert and save all json files to pandas dataframes and save as CSV
     
     Description
     
-    This function coverts all Yaml files from source directory to data frames. The data frames are 
-    then stored as .csv. The saved files are of the format team1-team2-date.RData For 
-    e.g. England-India-2008-04-06.RData etc
+    This function coverts all Cricsheet json files from source directory to data frames. The
+    data frames are then stored as .csv. The saved files are of the format team1-team2-date.csv
+    For e.g. England-India-2008-04-06.csv etc
     
     Usage
     
-    convertAllYaml2PandasDataframesT20(sourceDir=".",targetDir=".")
+    convertAllJson2PandasDataframesT20(sourceDir=".",targetDir=".",workers=1,chunksize=8,incremental=False,output_format="csv")
     Arguments
     
     sourceDir	
-    The source directory of the yaml files
+    The source directory of the json files. This can also be a zip archive of json files
+    e.g. ipl_json.zip from Cricsheet. The files are then read from the archive without extracting it
     targetDir	
-    The target directory in which the data frames are stored as RData files
+    The target directory in which the data frames are stored as CSV files
+    workers	
+    The number of worker processes. If workers > 1 the files are converted in a process pool.
+    Files which fail to convert are reported and the rest of the batch continues
+    chunksize	
+    The number of files handed to a worker process at a time when workers > 1
+    incremental	
+    If incremental=True only new or changed json files are converted. See
+    convertAllYaml2PandasDataframesT20()
+    output_format	
+    The format of the saved files - 'csv', 'parquet', 'feather' or 'store'. See
+    convertAllYaml2PandasDataframesT20()
     Value
     
-    None
-    
-    Note
-    
-    Maintainer: Tinniam V Ganesh tvganesh.85@gmail.com
-    
-    Author(s)
-    
-    Tinniam V Ganesh
+    failed The list of (file, error) for the files which failed to convert. The other files are 
+    converted
     
     References
     
     http://cricsheet.org/
     https://gigadom.in/
-
+    
     
     See Also
-
-    convertYaml2PandasDataframe
+    
+    convertJson2PandasDataframeT20
+    convertAllYaml2PandasDataframesT20
     Examples
-
-    # In the example below ../yamldir is the source dir for the yaml files
-    convertAllYaml2PandasDataframesT20("../yamldir","../data")
     
+    # In the example below ../jsondir is the source dir for the json files
+    convertAllJson2PandasDataframesT20("../jsondir","../data",workers=4)
     
     '''
-    files = os.listdir(source)
-    for index, file in enumerate(files):
-         print("\n\nFile no=",index)
-         if file.endswith(".yaml"):
-             df, filename = convertYaml2PandasDataframeT20(file, source, dest)
-             #print(filename)
-             
+    return(convertAllMatchFilesT20(convertJson2PandasDataframeT20, ".json", source, dest,
+                                   workers=workers, chunksize=chunksize, incremental=incremental,
+                                   output_format=output_format))
 
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -391,14 +1797,9 @@ def convertAllYaml2PandasDataframesT20(source,dest):
 
 ###########################################################################################             
 def getRuns(df):
-    df1=df[['batsman','runs','extras','total','non_boundary']]
     # Determine number of deliveries faced and runs scored
-    runs=df1[['batsman','runs']].groupby(['batsman'],sort=False,as_index=False).agg(['count','sum'])
-    # Drop level 0
-    runs.columns = runs.columns.droplevel(0)
-    runs=runs.reset_index(inplace=False)
-    runs.columns=['batsman','balls','runs']
-    return(runs)
+    runs=aggregate(df,['batsman'],{'runs':'runs'},count='balls')
+    return(runs[['batsman','balls','runs']])
     
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -414,8 +1815,7 @@ def getFours(df):
     # Get number of 4s. Check if it is boundary (non_boundary=0)
     m=df1.loc[(df1.runs >=4) & (df1.runs <6) & (df1.non_boundary==0)]
     # Count the number of 4s
-    noFours= m[['batsman','runs']].groupby('batsman',sort=False,as_index=False).count()
-    noFours.columns=['batsman','4s']
+    noFours=aggregate(m,['batsman'],{},count='4s')
     return(noFours)
     
 ##########################################################################################
@@ -430,10 +1830,32 @@ def getFours(df):
 def getSixes(df):
     df1=df[['batsman','runs','extras','total','non_boundary']]
     df2= df1.loc[(df1.runs ==6)]
-    sixes= df2[['batsman','runs']].groupby('batsman',sort=False,as_index=False).count()
-    sixes.columns=['batsman','6s']
+    sixes=aggregate(df2,['batsman'],{},count='6s')
     return(sixes)
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getBattingScorecard
+# This function gets the balls, runs, 4s, 6s and strike rate of batsmen in a single groupby
+#
+
+###########################################################################################
+def getBattingScorecard(df, by=None):
+    '''
+    Get the batting scorecard of the batsmen in deliveries. The balls faced, runs, 4s and 6s 
+    are summed in a single pass with aggregate(), with a boolean array for the 4s and the 6s, 
+    instead of separate groupbys for getRuns(), getFours() and getSixes() which are then 
+    merged. The batsmen are in the order in which they batted. The scorecards of several 
+    innings are computed in the same pass with the key columns in by e.g. ['match_id', 'team']
+    '''
+    keys = list(by) if by is not None else []
+    runs = df['runs'].values
+    # A boundary has non_boundary=0
+    fours = (runs >= 4) & (runs < 6) & (df['non_boundary'].values == 0)
+    e = aggregate(df, keys + ['batsman'], {'runs': runs, '4s': fours, '6s': runs == 6}, count='balls')
+    e['SR']=(e['runs']/e['balls']) *100
+    return(e[keys + ['batsman','runs','balls','4s','6s','SR']])
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 27 Dec 2018
@@ -512,21 +1934,57 @@ def teamBattingScorecardMatch (match,theTeam):
       team=match.loc[match['team'] == theTeam]
     else:
       return(scorecard,-1)
-    a1= getRuns(team)
-    b1= getFours(team)
-    c1= getSixes(team)
-    # Merge columns
-    d1=pd.merge(a1, b1, how='outer', on='batsman')
-    e=pd.merge(d1,c1,how='outer', on='batsman')
-    e=e.fillna(0)
-    
-    e['4s']=e['4s'].astype(int)
-    e['6s']=e['6s'].astype(int)
-    e['SR']=(e['runs']/e['balls']) *100
-    scorecard = e[['batsman','runs','balls','4s','6s','SR']]
+    # Balls, runs, 4s, 6s and strike rate in a single groupby
+    scorecard = getBattingScorecard(team)
     extras=getExtras(match)
     return(scorecard,extras)
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: battingScorecards
+# This function returns the batting scorecards of all innings of the matches
+#
+
+###########################################################################################
+def battingScorecards(deliveries):
+    '''
+    Batting scorecards of all the innings of the matches
+    
+    Description
+    
+    This function computes the batting scorecard (runs, balls, fours, sixes and strike rate) 
+    of every innings of the matches in a single groupby over the match, the team and the 
+    batsman, instead of calling teamBattingScorecardMatch() for each match and team. The 
+    matches are identified by match_id e.g. the matches loaded from a delivery store, or by the
+    date for the matches saved with saveAllMatchesBetween2IPLTeams()
+    
+    Usage
+    
+    battingScorecards(deliveries)
+    Arguments
+    
+    deliveries	
+    The deliveries of the matches
+    Value
+    
+    scorecards The data frame of the match_id (or date), team, batsman, runs, balls, 4s, 6s and
+    SR of every innings
+    
+    See Also
+    
+    teamBattingScorecardMatch
+    bowlingScorecards
+    loadDeliveryStore
+    Examples
+    
+    matches=loadDeliveryStore("../store")
+    scorecards=battingScorecards(matches)
+    # The scorecard of a team in a match
+    scorecards[(scorecards.match_id=='335982') & (scorecards.team=='Kolkata Knight Riders')]
+    '''
+    keys = getScorecardKeys(deliveries)
+    return(getBattingScorecard(deliveries, by=keys))
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 27 Dec 2018
@@ -537,10 +1995,9 @@ def teamBattingScorecardMatch (match,theTeam):
 ########################################################################################### 
 def getRunsConceded(df):
     # Note the column batsman has the runs scored by batsman
-    df1=df[['bowler','runs','wides', 'noballs']]
-    df2=df1.groupby('bowler').sum()
     # Only wides and no balls included in runs conceded
-    df2['runs']=(df2['runs']+df2['wides']+df2['noballs']).astype(int)
+    runs=df['runs'].values + df['wides'].values + df['noballs'].values
+    df2=aggregate(df,['bowler'],{'runs':runs},sort=True).set_index('bowler')
     df3 = df2['runs']
     return(df3)
 
@@ -553,9 +2010,8 @@ def getRunsConceded(df):
 
 ########################################################################################### 
 def getOvers(df):
-    df1=df[['bowler','delivery']]
-    df2=(df1.groupby('bowler').count()/6).astype(int)
-    df2.columns=['overs']
+    df2=aggregate(df,['bowler'],{},count='overs',sort=True).set_index('bowler')
+    df2['overs']=(df2['overs']/6).astype(int)
     return(df2)
     
 ##########################################################################################
@@ -568,24 +2024,20 @@ def getOvers(df):
 ########################################################################################### 
 
 def getMaidens(df):
-    df1=df[['bowler','delivery','runs','wides', 'noballs']]  
     # Get the over
-    df1['over']=df1.delivery.astype(int)
+    df1=pd.DataFrame({'bowler':df['bowler'],'over':df['delivery'].astype(int)})
     
     # Runs conceded includes wides and noballs
-    df1['runsConceded']=df1['runs'] + df1['wides'] + df1['noballs']
-    df2=df1[['bowler','over','runsConceded']]
+    runsConceded=df['runs'].values + df['wides'].values + df['noballs'].values
     
     # Compute runs in each over by bowler
-    df3=df2.groupby(['bowler','over']).sum()
-    df4=df3.reset_index(inplace=False)
+    df4=aggregate(df1,['bowler','over'],{'runsConceded':runsConceded},sort=True)
     
     # If maiden set as 1 else as 0
-    df4.loc[df4.runsConceded !=0,'maiden']=0
-    df4.loc[df4.runsConceded ==0,'maiden']=1
+    df4['maiden']=(df4.runsConceded ==0).astype(float)
     
     # Sum te maidens
-    df5=df4[['bowler','maiden']].groupby('bowler').sum()
+    df5=aggregate(df4,['bowler'],{'maiden':'maiden'},sort=True).set_index('bowler')
     return(df5)
     
 ##########################################################################################
@@ -600,18 +2052,69 @@ def getWickets(df):
 
     df1=df[['bowler','kind', 'player_out', 'fielders']]
     
-    # Check if the team took wickets. Then this column will be a string
-    if isinstance(df1.player_out.iloc[0],str):
-        df2= df1[df1.player_out !='0']
-        df3 = df2[['bowler','player_out']].groupby('bowler').count()
+    # Check if the team took wickets
+    wickets = notMissing(df1.player_out)
+    if wickets.any():
+        df2= df1[wickets]
+        df3 = aggregate(df2,['bowler'],{},count='player_out',sort=True).set_index('bowler')
     else: # Did not take wickets. Set wickets as 0
-        df3 = df1[['bowler','player_out']].groupby('bowler').count()
+        df3 = aggregate(df1,['bowler'],{},count='player_out',sort=True).set_index('bowler')
         df3['player_out']=0 # Set wicktes as 0
 
     return(df3)
 
 
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getBowlingScorecard
+# This function gets the overs, runs, maidens, wickets and economy rate of bowlers
+#
+
+###########################################################################################
+def getBowlingScorecard(df, by=None):
+    '''
+    Get the bowling scorecard of the bowlers in deliveries. Only legal deliveries, which are not
+    wides or no balls, are counted in the overs, and the remaining balls are kept e.g. 3.4 
+    overs is 3 overs and 4 balls. The runs conceded include the wides and no balls. A maiden 
+    is a complete over of a bowler without runs conceded, and only the dismissals in 
+    bowlerWicketKinds are credited to the bowler. The deliveries are summed for each over of 
+    each bowler first, and then for each bowler, with groupSum() over the codes of the 
+    bowlers, instead of separate groupbys for getOvers(), getRunsConceded(), getMaidens() and 
+    getWickets() which are then merged. The scorecards of several innings are computed in the 
+    same pass with the key columns in by e.g. ['match_id', 'team']
+    '''
+    keys = list(by) if by is not None else []
+    columns = keys + ['bowler','overs','runs','maidens','wicket','econrate']
+    if len(df) == 0:
+        return(pd.DataFrame(columns=columns))
+    wides = df['wides'].values.astype('int64')
+    noballs = df['noballs'].values.astype('int64')
+    balls = (wides == 0) & (noballs == 0)
+    runs = df['runs'].values.astype('int64') + wides + noballs
+    wickets = (notMissing(df['player_out']) & df['kind'].isin(bowlerWicketKinds)).values
+    # The bowlers, in each innings of by, are numbered in the order in which they first bowl
+    codes, first = getGroupCodes(df, keys + ['bowler'])
+    n = len(first)
+
+    # The overs of different innings, or matches, are kept apart
+    innings = getGroupCodes(df, [col for col in ('match_id', 'date', 'team') if col in df.columns])[0]
+    over = df['delivery'].values.astype('int64')
+    overIndex, overs = pd.factorize((innings * n + codes) * 1000 + over)
+    overBalls = groupSum(overIndex, balls, len(overs))
+    overRuns = groupSum(overIndex, runs, len(overs))
+    maidens = (overBalls == 6) & (overRuns == 0)
+
+    g1 = pd.DataFrame({col: df[col].values[first] for col in keys + ['bowler']})
+    g1 = g1.assign(balls=groupSum(codes, balls, n),
+                   runs=groupSum(codes, runs, n),
+                   maidens=groupSum((overs // 1000) % n, maidens, n),
+                   wicket=groupSum(codes, wickets, n))
+    # Overs like 3.4 are 3 overs and 4 balls
+    g1['overs'] = g1['balls'] // 6 + (g1['balls'] % 6) / 10
+    g1['econrate'] = g1['runs'] / (g1['balls'] / 6)
+    return(g1[columns])
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 27 Dec 2018
@@ -666,25 +2169,325 @@ def teamBowlingScorecardMatch (match,theTeam):
     print(m)
     '''
     team=match.loc[match.team== theTeam]
-    # Compute overs bowled
-    a1= getOvers(team).reset_index(inplace=False)
-    # Compute runs conceded
-    b1= getRunsConceded(team).reset_index(inplace=False)   
-    # Compute maidens
-    c1= getMaidens(team).reset_index(inplace=False)   
-    # Compute wickets
-    d1= getWickets(team).reset_index(inplace=False)
-    e1=pd.merge(a1, b1, how='outer', on='bowler')
-    f1= pd.merge(e1,c1,how='outer', on='bowler')
-    g1= pd.merge(f1,d1,how='outer', on='bowler')
-    g1 = g1.fillna(0)
-    # Compute economy rate
-    g1['econrate'] = g1['runs']/g1['overs']
-    g1.columns=['bowler','overs','runs','maidens','wicket','econrate']
-    g1.maidens = g1.maidens.astype(int)
-    g1.wicket = g1.wicket.astype(int)
+    # Overs of legal deliveries, runs conceded, maidens, wickets and economy rate in a single pass
+    g1= getBowlingScorecard(team)
     return(g1)
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: bowlingScorecards
+# This function returns the bowling scorecards of all innings of the matches
+#
+
+###########################################################################################
+def bowlingScorecards(deliveries):
+    '''
+    Bowling scorecards of all the innings of the matches
+    
+    Description
+    
+    This function computes the bowling scorecard (overs, runs, maidens, wickets and economy 
+    rate) of every innings of the matches in a single pass over the match, the team and the 
+    bowler, instead of calling teamBowlingScorecardMatch() for each match and team. As in 
+    teamBowlingScorecardMatch() the team is the batting team, i.e. the bowlers are of the 
+    opposition. The matches are identified by match_id e.g. the matches loaded from a delivery 
+    store, or by the date for the matches saved with saveAllMatchesBetween2IPLTeams()
+    
+    Usage
+    
+    bowlingScorecards(deliveries)
+    Arguments
+    
+    deliveries	
+    The deliveries of the matches
+    Value
+    
+    scorecards The data frame of the match_id (or date), team, bowler, overs, runs, maidens, 
+    wicket and econrate of every innings
+    
+    See Also
+    
+    teamBowlingScorecardMatch
+    battingScorecards
+    loadDeliveryStore
+    Examples
+    
+    matches=loadDeliveryStore("../store")
+    scorecards=bowlingScorecards(matches)
+    # The bowlers who bowled to a team in a match
+    scorecards[(scorecards.match_id=='335982') & (scorecards.team=='Kolkata Knight Riders')]
+    '''
+    keys = getScorecardKeys(deliveries)
+    return(getBowlingScorecard(deliveries, by=keys))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getScorecardKeys
+# This function gets the columns which identify the innings of the matches
+#
+
+###########################################################################################
+def getScorecardKeys(deliveries):
+    if 'match_id' in deliveries.columns:
+        return(['match_id', 'team'])
+    return(['date', 'team'])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: battingPartnerships
+# This function returns the partnerships of all innings of the matches
+#
+
+###########################################################################################
+def battingPartnerships(deliveries):
+    '''
+    Batting partnerships of all the innings of the matches
+    
+    Description
+    
+    This function computes every partnership of every innings of the matches in a single pass. 
+    The partnerships are numbered with a cumulative count of the batsmen out in each innings, 
+    so the stands of the same pair of batsmen in different matches or innings are kept apart, 
+    unlike teamBatsmenPartnershipMatch() which sums the runs of each (batsman, non_striker). 
+    The runs of a partnership include the extras, and the balls exclude the wides. A stand 
+    ends with a dismissal or a retirement. The deliveries of each innings must be in the 
+    order in which they were bowled, as in the converted matches. The matches are identified 
+    by match_id, or by the date as in battingScorecards()
+    
+    Usage
+    
+    battingPartnerships(deliveries)
+    Arguments
+    
+    deliveries	
+    The deliveries of the matches
+    Value
+    
+    partnerships The data frame of the match_id (or date), team, wicket (1 for the opening 
+    stand), batsman1 (the striker at the start of the stand), batsman2, runs, balls, extras, 
+    the runs and balls of batsman1 and batsman2, and the playerOut, kind and bowler of the 
+    wicket which ended the stand. These are null for an unbroken stand
+    
+    See Also
+    
+    teamBatsmenPartnershipMatch
+    battingScorecards
+    loadDeliveryStore
+    Examples
+    
+    matches=loadDeliveryStore("../store")
+    partnerships=battingPartnerships(matches)
+    # The highest partnerships of all matches
+    partnerships.sort_values('runs',ascending=False).head(10)
+    '''
+    keys = getScorecardKeys(deliveries)
+    columns = keys + ['wicket','batsman1','batsman2','runs','balls','extras','batsman1Runs',
+                      'batsman1Balls','batsman2Runs','batsman2Balls','playerOut','kind','bowler']
+    if len(deliveries) == 0:
+        return(pd.DataFrame(columns=columns))
+
+    # The deliveries of each innings are put together, in the order in which they were bowled
+    innings = getGroupCodes(deliveries, keys)[0]
+    order = np.argsort(innings, kind='stable')
+    innings = innings[order]
+    out = notMissing(deliveries['player_out']).values[order].astype('int64')
+    start = np.concatenate(([True], innings[1:] != innings[:-1]))
+
+    # The number of batsmen out before each delivery of the innings numbers the stands
+    fallen = np.cumsum(out) - out
+    stand = fallen - fallen[start][innings]
+    first = np.flatnonzero(start | np.concatenate(([True], stand[1:] != stand[:-1])))
+    last = np.append(first[1:] - 1, len(order) - 1)
+    starts = np.zeros(len(order), dtype='int64')
+    starts[first] = 1
+    codes = np.cumsum(starts) - 1
+    n = len(first)
+
+    # The deliveries faced by the striker at the start of the stand are of batsman1, the others
+    # are of the partner
+    batsman = pd.factorize(deliveries['batsman'])[0][order]
+    isBatsman1 = batsman == batsman[first][codes]
+    runs = deliveries['runs'].values[order].astype('int64')
+    extras = deliveries['extras'].values[order].astype('int64')
+    faced = deliveries['wides'].values[order] == 0
+
+    def values(col, rows):
+        return(deliveries[col].values[order[rows]])
+    p = pd.DataFrame({col: values(col, first) for col in keys})
+    p['wicket'] = stand[first] + 1
+    p['batsman1'] = values('batsman', first)
+    p['batsman2'] = values('non_striker', first)
+    p['runs'] = groupSum(codes, runs + extras, n)
+    p['balls'] = groupSum(codes, faced, n)
+    p['extras'] = groupSum(codes, extras, n)
+    p['batsman1Runs'] = groupSum(codes, runs * isBatsman1, n)
+    p['batsman1Balls'] = groupSum(codes, faced & isBatsman1, n)
+    p['batsman2Runs'] = p['runs'] - p['extras'] - p['batsman1Runs']
+    p['batsman2Balls'] = p['balls'] - p['batsman1Balls']
+
+    # The last delivery of a stand which was broken has the wicket
+    broken = out[last] == 1
+    for col, name in (('player_out', 'playerOut'), ('kind', 'kind'), ('bowler', 'bowler')):
+        p[name] = pd.Series(values(col, last)).where(broken)
+    return(p[columns])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getDismissals
+# This function gets the dismissals of the matches with one row for each fielder
+#
+
+###########################################################################################
+def getDismissals(deliveries):
+    '''
+    Get the dismissal table of deliveries
+    
+    Description
+    
+    This function normalizes the dismissals of the matches into a table with one row for each 
+    fielder of a dismissal. The fielders column e.g. ['KD Karthik', 'AB de Villiers'] is parsed 
+    once for each distinct value with vectorized string functions. A dismissal without 
+    fielders e.g. bowled has one row with a null fielder, and the bowler is the fielder of a 
+    caught and bowled. A substitute e.g. 'sub (MK Pandey)' is credited to MK Pandey and marked 
+    as a substitute. The dismissal tables of the matches in a directory are built once when 
+    the matches are converted and kept with the player-match tables
+    
+    Usage
+    
+    getDismissals(deliveries)
+    Arguments
+    
+    deliveries	
+    The deliveries of the matches
+    Value
+    
+    dismissals The data frame of the match_id (or date), team (the batting team), 
+    fieldingTeam, delivery, player_out, kind, bowler, fielder, substitute and fielders (the 
+    number of fielders of the dismissal) of each fielder of each dismissal
+    
+    See Also
+    
+    fieldingScorecards
+    getPlayerMatchTable
+    rankFielders
+    Examples
+    
+    matches=loadDeliveryStore("../store")
+    dismissals=getDismissals(matches)
+    # The run outs of the matches
+    dismissals[dismissals.kind=='run out']
+    '''
+    keys = getScorecardKeys(deliveries)
+    if 'date' not in keys and 'date' in deliveries.columns:
+        keys = keys + ['date']
+    df = deliveries[notMissing(deliveries['player_out'])]
+    d = pd.DataFrame({col: df[col].values for col in keys + ['delivery','player_out','kind','bowler']})
+    if 'team1' in df.columns and 'team2' in df.columns:
+        team = df['team'].values.astype(object)
+        team1 = df['team1'].values.astype(object)
+        d.insert(len(keys), 'fieldingTeam', np.where(team == team1, df['team2'].values.astype(object), team1))
+    else:
+        d.insert(len(keys), 'fieldingTeam', None)
+
+    # The names of each distinct value of fielders are parsed once
+    present = notMissing(df['fielders']).values
+    codes, uniques = pd.factorize(df['fielders'].astype(str))
+    codes[~present] = -1
+    names = pd.Series(uniques).str.strip('[]').str.split(', ').explode().str.strip(' \'"')
+    fielders = pd.DataFrame({'code': names.index, 'fielder': names.values})
+    counts = fielders.groupby('code').size()
+    d['code'] = codes
+    d['fielders'] = counts.reindex(codes, fill_value=0).values.astype('int64')
+    d = d.merge(fielders, on='code', how='left').drop(columns='code')
+
+    # The bowler takes the catch of a caught and bowled
+    caughtAndBowled = (d['kind'] == 'caught and bowled').values & (d['fielders'].values == 0)
+    d['fielder'] = d['fielder'].where(~caughtAndBowled, d['bowler'].astype(object))
+    d['fielders'] = np.where(caughtAndBowled, 1, d['fielders'])
+    substitute = d['fielder'].str.match(r'sub \(.*\)$')
+    d['substitute'] = substitute.fillna(False).astype(bool)
+    d['fielder'] = d['fielder'].str.replace(r'^sub \((.*)\)$', r'\1', regex=True)
+    return(d[keys[:1] + ['team','fieldingTeam'] + keys[2:] + dismissalColumns])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getFieldingScorecard
+# This function gets the catches, stumpings and run outs of fielders
+#
+
+###########################################################################################
+def getFieldingScorecard(dismissals, by=None):
+    '''
+    Get the fielding scorecard of the fielders in a dismissal table, with the key columns in 
+    by e.g. ['match_id', 'fieldingTeam']. soleFielderRunOuts counts the run outs in which the 
+    fielder was the only fielder named. Cricsheet does not mark direct hits, so this is only an 
+    approximation of them, since the fielder may have thrown to the keeper or the bowler
+    '''
+    keys = list(by) if by is not None else []
+    columns = keys + ['fielder','catches','stumpings','runOuts','soleFielderRunOuts','total']
+    fielded = dismissals[notMissing(dismissals['fielder'])]
+    if len(fielded) == 0:
+        return(pd.DataFrame(columns=columns))
+    kind = fielded['kind']
+    runOuts = (kind == 'run out').values
+    f = aggregate(fielded, keys + ['fielder'],
+                  {'catches': kind.isin(['caught', 'caught and bowled']).values,
+                   'stumpings': (kind == 'stumped').values,
+                   'runOuts': runOuts,
+                   'soleFielderRunOuts': runOuts & (fielded['fielders'].values == 1)})
+    f['total'] = f['catches'] + f['stumpings'] + f['runOuts']
+    return(f[columns])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: fieldingScorecards
+# This function returns the fielding scorecards of all innings of the matches
+#
+
+###########################################################################################
+def fieldingScorecards(deliveries):
+    '''
+    Fielding scorecards of all the innings of the matches
+    
+    Description
+    
+    This function computes the catches, stumpings and run outs of the fielders of each team 
+    in the field in every innings of the matches. A run out is credited to each of its 
+    fielders. The run outs in which the fielder was the only fielder named are also counted. 
+    This approximates the direct hits, which Cricsheet does not mark. The 
+    deliveries can also be a dismissal table from getDismissals() or 
+    getPlayerMatchTable(dir,'dismissals'), in which case the fielders are not parsed again
+    
+    Usage
+    
+    fieldingScorecards(deliveries)
+    Arguments
+    
+    deliveries	
+    The deliveries of the matches, or their dismissal table
+    Value
+    
+    scorecards The data frame of the match_id (or date), fieldingTeam, fielder, catches, 
+    stumpings, runOuts, soleFielderRunOuts (an approximation of the direct hits) and total of
+    every innings
+    
+    See Also
+    
+    getDismissals
+    rankFielders
+    battingScorecards
+    bowlingScorecards
+    Examples
+    
+    matches=loadDeliveryStore("../store")
+    scorecards=fieldingScorecards(matches)
+    # The fielding of a team in a match
+    scorecards[(scorecards.match_id=='335982') & (scorecards.fieldingTeam=='Kolkata Knight Riders')]
+    '''
+    dismissals = deliveries if 'fielder' in deliveries.columns else getDismissals(deliveries)
+    keys = getScorecardKeys(dismissals)
+    return(getFieldingScorecard(dismissals, by=[keys[0], 'fieldingTeam']))
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 27 Dec 2018
@@ -754,7 +2557,7 @@ def teamBatsmenPartnershipMatch(match,theTeam,opposition,plot=True,savePic=False
     df1=match.loc[match.team== theTeam]
     df2= df1[['batsman','runs','non_striker']]    
     if plot == True:
-        df3=df2.groupby(['batsman','non_striker']).sum().unstack().fillna(0)
+        df3=df2.groupby(['batsman','non_striker'],observed=True).sum(numeric_only=True).unstack().fillna(0)
         rcParams['figure.figsize'] = 10, 6
         df3.plot(kind='bar',stacked=True)
         plt.xlabel('Batsman')
@@ -770,7 +2573,7 @@ def teamBatsmenPartnershipMatch(match,theTeam,opposition,plot=True,savePic=False
             plt.show()
         plt.gcf().clear()
     else:
-        df3=df2.groupby(['batsman','non_striker']).sum().reset_index(inplace=False)
+        df3=df2.groupby(['batsman','non_striker'],observed=True).sum(numeric_only=True).reset_index(inplace=False)
         return(df3)
         
 ##########################################################################################
@@ -841,7 +2644,7 @@ def teamBatsmenVsBowlersMatch(match,theTeam,opposition, plot=True, savePic=False
     df2= df1[['batsman','runs','bowler']]
 
     if plot == True:
-        df3=df2.groupby(['batsman','bowler']).sum().unstack().fillna(0)
+        df3=df2.groupby(['batsman','bowler'],observed=True).sum(numeric_only=True).unstack().fillna(0)
         df3.plot(kind='bar',stacked=True)
         rcParams['figure.figsize'] = 10, 6
         plt.xlabel('Batsman')
@@ -857,7 +2660,7 @@ def teamBatsmenVsBowlersMatch(match,theTeam,opposition, plot=True, savePic=False
             plt.show()
         plt.gcf().clear()
     else:
-        df3=df2.groupby(['batsman','bowler']).sum().reset_index(inplace=False)
+        df3=aggregate(df2,['batsman','bowler'],{'runs':'runs'},sort=True)
         return(df3)
         
 ##########################################################################################
@@ -927,11 +2730,11 @@ def teamBowlingWicketKindMatch(match,theTeam,opposition, plot=True,savePic=False
     df1=match.loc[match.team== theTeam]
     df2= df1[['bowler','kind','player_out']]
     # Find all rows where there was a wicket
-    df3=df2[df2.player_out != '0']
+    df3=df2[notMissing(df2.player_out)]
     
     if plot == True:
         # Find the different types of wickets for each bowler
-        df4=df3.groupby(['bowler','kind']).count().unstack().fillna(0)
+        df4=df3.groupby(['bowler','kind'],observed=True).count().unstack().fillna(0)
         df4.plot(kind='bar',stacked=True)
         rcParams['figure.figsize'] = 10, 6
         plt.xlabel('Batsman')
@@ -948,7 +2751,7 @@ def teamBowlingWicketKindMatch(match,theTeam,opposition, plot=True,savePic=False
         plt.gcf().clear()
     else:
         # Find the different types of wickets for each bowler
-        df4=df3.groupby(['bowler','kind']).count().reset_index(inplace=False)
+        df4=df3.groupby(['bowler','kind'],observed=True).count().reset_index(inplace=False)
         return(df4)
         
 ##########################################################################################
@@ -1019,11 +2822,11 @@ def teamBowlingWicketMatch(match,theTeam,opposition, plot=True,savePic=False, di
     df1=match.loc[match.team== theTeam]
     df2= df1[['bowler','kind','player_out']]
     # Find all rows where there was a wicket
-    df3=df2[df2.player_out != '0']
+    df3=df2[notMissing(df2.player_out)]
     
     if plot == True:
         # Find the different types of wickets for each bowler
-        df4=df3.groupby(['bowler','player_out']).count().unstack().fillna(0)
+        df4=df3.groupby(['bowler','player_out'],observed=True).count().unstack().fillna(0)
         df4.plot(kind='bar',stacked=True)
         rcParams['figure.figsize'] = 10, 6
         plt.xlabel('Batsman')
@@ -1040,7 +2843,7 @@ def teamBowlingWicketMatch(match,theTeam,opposition, plot=True,savePic=False, di
         plt.gcf().clear()
     else:
         # Find the different types of wickets for each bowler
-        df4=df3.groupby(['bowler','player_out']).count().reset_index(inplace=False)
+        df4=df3.groupby(['bowler','player_out'],observed=True).count().reset_index(inplace=False)
         return(df4)
         
 ##########################################################################################
@@ -1109,7 +2912,7 @@ def teamBowlersVsBatsmenMatch (match,theTeam,opposition, plot=True, savePic=Fals
     df2= df1[['batsman','runs','bowler']]
     
     if plot == True:
-        df3=df2.groupby(['batsman','bowler']).sum().unstack().fillna(0)
+        df3=df2.groupby(['batsman','bowler'],observed=True).sum(numeric_only=True).unstack().fillna(0)
         df3.plot(kind='bar',stacked=True)
         rcParams['figure.figsize'] = 10, 6
         plt.xlabel('Batsman')
@@ -1125,7 +2928,7 @@ def teamBowlersVsBatsmenMatch (match,theTeam,opposition, plot=True, savePic=Fals
             plt.show()
         plt.gcf().clear()
     else:
-        df3=df2.groupby(['batsman','bowler']).sum().reset_index(inplace=False)
+        df3=aggregate(df2,['batsman','bowler'],{'runs':'runs'},sort=True)
         return(df3)
         
 ##########################################################################################
@@ -1231,7 +3034,7 @@ def matchWormChart(match,team1,team2,plot=True, savePic=False, dir1=".",picFile=
 #
 ###########################################################################################
     
-def getAllMatchesBetweenTeams(team1,team2,dir=".",save=False,odir="."):
+def getAllMatchesBetweenTeams(team1,team2,dir=".",save=False,odir=".",columns=None):
     '''
     Get data on all matches between 2 opposing teams
     
@@ -1241,7 +3044,7 @@ def getAllMatchesBetweenTeams(team1,team2,dir=".",save=False,odir="."):
     between these teams.
     
     Usage
-    getAllMatchesBetweenTeams(team1,team2,dir=".",save=FALSE)
+    getAllMatchesBetweenTeams(team1,team2,dir=".",save=FALSE,columns=None)
     Arguments
     
     team1	
@@ -1249,11 +3052,14 @@ def getAllMatchesBetweenTeams(team1,team2,dir=".",save=False,odir="."):
     team2	
     The other team for which matches are needed e.g( MI, GL)
     dir	
-    The directory which has the RData files of matches between teams
+    The directory which has the RData files of matches between teams. The matches are found
+    with the match catalog of the directory. See getMatchCatalog()
     save	
     Default=False. This parameter indicates whether the combined data frame 
     needs to be saved or not. It is recommended to save this large dataframe as 
     the creation of this data frame takes a several seconds depending on the number of matches
+    columns	
+    The list of columns to read from the matches. All columns are read if None
     Value   
     matches - The combined data frame
     
@@ -1277,19 +3083,13 @@ def getAllMatchesBetweenTeams(team1,team2,dir=".",save=False,odir="."):
 
     '''
 
-    # Create the 2 combinations
-    t1 = team1 +'-' + team2 + '*.csv'
-    t2 = team2 + '-' + team1 + '*.csv'
-    path1= os.path.join(dir,t1)
-    path2 = os.path.join(dir,t2)
-    files = glob.glob(path1) + glob.glob(path2)  
-    print(len(files))
+    # Get the matches between the 2 teams from the match catalog of the directory
+    matches = findTeamMatches(dir,team1,team2)
+    print(len(matches))
     # Save as CSV only if there are matches between the 2 teams
-    if len(files) !=0:
-        df = pd.DataFrame()
-        for file in files:
-            df1 = pd.read_csv(file)
-            df=pd.concat([df,df1])    
+    if len(matches) !=0:
+        # The categorical columns of the matches are combined
+        df = concatMatches(list(loadCatalogMatches(dir,matches,columns)))
         if save==True:
             dest= team1 +'-' + team2 + '-allMatches.csv'    
             output=os.path.join(odir,dest)
@@ -1297,6 +3097,64 @@ def getAllMatchesBetweenTeams(team1,team2,dir=".",save=False,odir="."):
         else:
            return(df) 
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveAllMatchesBetweenTeamPairs
+# This function saves all the matches between each pair of teams in a single pass
+#
+###########################################################################################
+
+def saveAllMatchesBetweenTeamPairs(teams,dir1,odir="."):
+    '''
+    Saves all matches between each pair of teams as dataframes
+    
+    Description
+    
+    This function saves the matches between each pair of teams of a league in a single pass.
+    The matches are taken from the match catalog of the directory and are grouped by the pair
+    of teams, so that each match is read once. The matches of a pair are saved as 
+    team1-team2-allMatches.csv, where team1 is the team which is earlier in the list of teams, 
+    and the file is copied to team2-team1-allMatches.csv so that both names can be loaded
+    
+    Usage
+    
+    saveAllMatchesBetweenTeamPairs(teams,dir1,odir=".")
+    Arguments
+    
+    teams	
+    The list of teams of the league
+    dir1	
+    The directory of the converted matches
+    odir	
+    The directory in which the matches between the teams are saved
+    Value
+    
+    None
+    
+    See Also
+    
+    getAllMatchesBetweenTeams
+    saveAllMatchesBetween2IPLTeams
+    '''
+    position = {team: index for index, team in enumerate(teams)}
+    catalog = getMatchCatalog(dir1)
+    catalog = catalog[catalog.team1.isin(position) & catalog.team2.isin(position)]
+    if len(catalog) == 0:
+        return
+
+    # Order the 2 teams of each match as in the list of teams
+    swap = catalog.team1.map(position) > catalog.team2.map(position)
+    first = catalog.team1.where(~swap, catalog.team2)
+    second = catalog.team2.where(~swap, catalog.team1)
+    for (team1, team2), matches in catalog.groupby([first, second], sort=False):
+        print("Team1=",team1,"team2=", team2, "matches=", len(matches))
+        df = concatMatches(list(loadCatalogMatches(dir1,matches)))
+        dest= team1 +'-' + team2 + '-allMatches.csv'
+        df.to_csv(os.path.join(odir,dest))
+        # The file is copied rather than written again
+        shutil.copyfile(os.path.join(odir,dest), os.path.join(odir,team2 +'-' + team1 + '-allMatches.csv'))
+    return
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 26 Jan 2019
@@ -1315,7 +3173,7 @@ def saveAllMatchesBetween2IPLTeams(dir1,odir="."):
     
     Usage
     
-    saveAllMatchesBetween2IPLTeams(dir)
+    saveAllMatchesBetween2IPLTeams(dir1,odir=".")
     Arguments
     
     dir	
@@ -1348,12 +3206,8 @@ def saveAllMatchesBetween2IPLTeams(dir1,odir="."):
                   "Royal Challengers Bangalore","Sunrisers Hyderabad","Gujarat Lions",
                   "Rising Pune Supergiants"]
     
-    for team1 in teams:
-        for team2 in teams:
-            if team1 != team2:
-                print("Team1=",team1,"team2=", team2)
-                getAllMatchesBetweenTeams(team1,team2,dir=dir1,save=True,odir=odir)
-                time.sleep(2) #Sleep before  next save   
+    # Each match is read once and saved once for its pair of teams
+    saveAllMatchesBetweenTeamPairs(teams,dir1,odir)
                 
     return    
 
@@ -1417,11 +3271,11 @@ def teamBatsmenPartnershiOppnAllMatches(matches,theTeam,report="summary",top=5):
     df2 = df1[['batsman','non_striker','runs']]
     
     # Compute partnerships
-    df3=df2.groupby(['batsman','non_striker']).sum().reset_index(inplace=False)
+    df3=df2.groupby(['batsman','non_striker'],observed=True).sum(numeric_only=True).reset_index(inplace=False)
     df3.columns = ['batsman','non_striker','partnershipRuns']
     
     # Compute total partnerships
-    df4 = df3.groupby('batsman').sum().reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
+    df4 = df3.groupby('batsman',observed=True).sum(numeric_only=True).reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
     df4.columns = ['batsman','totalPartnershipRuns']
     
     # Select top 5
@@ -1506,11 +3360,11 @@ def teamBatsmenPartnershipOppnAllMatchesChart(matches,main,opposition,plot=True,
     df2 = df1[['batsman','non_striker','runs']]
     
     # Compute partnerships
-    df3=df2.groupby(['batsman','non_striker']).sum().reset_index(inplace=False)
+    df3=df2.groupby(['batsman','non_striker'],observed=True).sum(numeric_only=True).reset_index(inplace=False)
     df3.columns = ['batsman','non_striker','partnershipRuns']
     
     # Compute total partnerships
-    df4 = df3.groupby('batsman').sum().reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
+    df4 = df3.groupby('batsman',observed=True).sum(numeric_only=True).reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
     df4.columns = ['batsman','totalPartnershipRuns']
     
     
@@ -1522,7 +3376,7 @@ def teamBatsmenPartnershipOppnAllMatchesChart(matches,main,opposition,plot=True,
     # Remove rows where partnershipRuns < partnershipRuns as there are too many
     df8 = df7[df7['partnershipRuns'] > partnershipRuns]
     
-    df9=df8.groupby(['batsman','non_striker'])['partnershipRuns'].sum().unstack().fillna(0)
+    df9=df8.groupby(['batsman','non_striker'],observed=True)['partnershipRuns'].sum().unstack().fillna(0)
     # Note: Can also use the below code -*************
     #df8=df7.pivot(columns='non_striker',index='batsman').fillna(0)
  
@@ -1606,19 +3460,17 @@ def teamBatsmenVsBowlersOppnAllMatches(matches,main,opposition,plot=True,top=5,r
     df2 = df1[['batsman','bowler','runs']]
     
     # Runs scored by bowler
-    df3=df2.groupby(['batsman','bowler']).sum().reset_index(inplace=False)
-    df3.columns = ['batsman','bowler','runsScored']
+    df3=aggregate(df2,['batsman','bowler'],{'runsScored':'runs'},sort=True)
     
     # Need to pick the 'top' number of bowlers
-    df4 = df3.groupby('batsman').sum().reset_index(inplace=False).sort_values('runsScored',ascending=False)
-    df4.columns = ['batsman','totalRunsScored']
+    df4 = aggregate(df3,['batsman'],{'totalRunsScored':'runsScored'},sort=True).sort_values('totalRunsScored',ascending=False)
     df5 = df4.head(top)
     df6= pd.merge(df5,df3,on='batsman')
     df7 = df6[['batsman','bowler','runsScored']]
     
     # Remove rows where runsScored < runsScored as there are too many
     df8 = df7[df7['runsScored'] >runsScored]
-    df9=df8.groupby(['batsman','bowler'])['runsScored'].sum().unstack().fillna(0)
+    df9=df8.groupby(['batsman','bowler'],observed=True)['runsScored'].sum().unstack().fillna(0)
     # Note: Can also use the below code -*************
     #df8=df7.pivot(columns='bowler',index='batsman').fillna(0)
     
@@ -1687,19 +3539,8 @@ def teamBattingScorecardOppnAllMatches(matches,main,opposition):
     teamBowlingWicketKindOppositionAllMatches    
     '''
     team=matches.loc[matches.team== main]
-    a1= getRuns(team)
-    b1= getFours(team)
-    c1= getSixes(team)
-    
-    # Merge columns
-    d1=pd.merge(a1, b1, how='outer', on='batsman')
-    e=pd.merge(d1,c1,how='outer', on='batsman')
-    e=e.fillna(0)
-    
-    e['4s']=e['4s'].astype(int)
-    e['6s']=e['6s'].astype(int)
-    e['SR']=(e['runs']/e['balls']) *100
-    scorecard = e[['batsman','runs','balls','4s','6s','SR']].sort_values('runs',ascending=False)
+    # Balls, runs, 4s, 6s and strike rate in a single groupby
+    scorecard = getBattingScorecard(team).sort_values('runs',ascending=False)
     return(scorecard)   
 
 ##########################################################################################
@@ -1752,23 +3593,8 @@ def teamBowlingScorecardOppnAllMatches(matches,main,opposition):
     plotWinsbyTossDecision
     '''
     team=matches.loc[matches.team== main] 
-    # Compute overs bowled
-    a1= getOvers(team).reset_index(inplace=False)
-    # Compute runs conceded
-    b1= getRunsConceded(team).reset_index(inplace=False)   
-    # Compute maidens
-    c1= getMaidens(team).reset_index(inplace=False)   
-    # Compute wickets
-    d1= getWickets(team).reset_index(inplace=False)
-    e1=pd.merge(a1, b1, how='outer', on='bowler')
-    f1= pd.merge(e1,c1,how='outer', on='bowler')
-    g1= pd.merge(f1,d1,how='outer', on='bowler')
-    g1 = g1.fillna(0)
-    # Compute economy rate
-    g1['econrate'] = g1['runs']/g1['overs']
-    g1.columns=['bowler','overs','runs','maidens','wicket','econrate']
-    g1.maidens = g1.maidens.astype(int)
-    g1.wicket = g1.wicket.astype(int)
+    # Overs of legal deliveries, runs conceded, maidens, wickets and economy rate in a single pass
+    g1= getBowlingScorecard(team)
     g2 = g1.sort_values('wicket',ascending=False)
     return(g2)
     
@@ -1839,14 +3665,14 @@ def teamBowlingWicketKindOppositionAllMatches(matches,main,opposition,plot=True,
     df2= df1[['bowler','kind','player_out']]
 
     # Find all rows where there was a wicket
-    df2=df2[df2.player_out != '0']
+    df2=df2[notMissing(df2.player_out)]
     
     # Number of wickets taken by bowler
-    df3=df2.groupby(['bowler','kind']).count().reset_index(inplace=False)
+    df3=df2.groupby(['bowler','kind'],observed=True).count().reset_index(inplace=False)
     df3.columns = ['bowler','kind','wickets']
     
     # Need to pick the 'top' number of bowlers by wickets
-    df4 = df3.groupby('bowler').sum().reset_index(inplace=False).sort_values('wickets',ascending=False)
+    df4 = df3.groupby('bowler',observed=True).sum(numeric_only=True).reset_index(inplace=False).sort_values('wickets',ascending=False)
     df4.columns = ['bowler','totalWickets']
     df5 = df4.head(top)
     df6= pd.merge(df5,df3,on='bowler')
@@ -1855,7 +3681,7 @@ def teamBowlingWicketKindOppositionAllMatches(matches,main,opposition,plot=True,
     
     # Remove rows where runsScored < runsScored as there are too many
     df8 = df7[df7['wickets'] >wickets]
-    df9=df8.groupby(['bowler','kind'])['wickets'].sum().unstack().fillna(0)   
+    df9=df8.groupby(['bowler','kind'],observed=True)['wickets'].sum().unstack().fillna(0)   
     # Note: Can also use the below code -*************
     #df9=df8.pivot(columns='bowler',index='batsman').fillna(0)
 
@@ -1940,12 +3766,10 @@ def teamBowlersVsBatsmenOppnAllMatches(matches,main,opposition,plot=True,top=5,r
     df2= df1[['bowler','batsman','runs']]
     
     # Number of wickets taken by bowler
-    df3=df2.groupby(['bowler','batsman']).sum().reset_index(inplace=False)
-    df3.columns = ['bowler','batsman','runsConceded']
+    df3=aggregate(df2,['bowler','batsman'],{'runsConceded':'runs'},sort=True)
     
     # Need to pick the 'top' number of bowlers by wickets
-    df4 = df3.groupby('bowler').sum().reset_index(inplace=False).sort_values('runsConceded',ascending=False)
-    df4.columns = ['bowler','totalRunsConceded']
+    df4 = aggregate(df3,['bowler'],{'totalRunsConceded':'runsConceded'},sort=True).sort_values('totalRunsConceded',ascending=False)
     df5 = df4.head(top)
     df6= pd.merge(df5,df3,on='bowler')
     df7 = df6[['bowler','batsman','runsConceded']]
@@ -1953,7 +3777,7 @@ def teamBowlersVsBatsmenOppnAllMatches(matches,main,opposition,plot=True,top=5,r
     
     # Remove rows where runsScored < runsScored as there are too many
     df8 = df7[df7['runsConceded'] >runsConceded]
-    df9=df8.groupby(['bowler','batsman'])['runsConceded'].sum().unstack().fillna(0)   
+    df9=df8.groupby(['bowler','batsman'],observed=True)['runsConceded'].sum().unstack().fillna(0)   
     # Note: Can also use the below code -*************
     #df9=df8.pivot(columns='bowler',index='batsman').fillna(0)
     
@@ -2030,7 +3854,7 @@ def plotWinLossBetweenTeams(matches,team1,team2,plot=True, savePic=False, dir1="
     teamBatsmenPartnershipOppnAllMatchesChart
     getAllMatchesBetweenTeams
     '''
-    a=matches[['date','winner']].groupby(['date','winner']).count().reset_index(inplace=False)
+    a=getMatchWinners(matches).groupby(['date','winner']).count().reset_index(inplace=False)
     b=a.groupby('winner').count().reset_index(inplace=False)
     b.columns = ['winner','number']
     sns.barplot(x='winner',y='number',data=b)
@@ -2108,8 +3932,8 @@ def plotWinsByRunOrWickets(matches,team1,plot=True, savePic=False, dir1=".",picF
     '''
     # Get the number of matches won
     df= matches.loc[matches.winner == team1]
-    a=df[['date','winType']].groupby(['date','winType']).count().reset_index(inplace=False)
-    b=a.groupby('winType').count().reset_index(inplace=False)
+    a=df[['date','winType']].groupby(['date','winType'],observed=True).count().reset_index(inplace=False)
+    b=a.groupby('winType',observed=True).count().reset_index(inplace=False)
     b.columns = ['winType','number']
     sns.barplot(x='winType',y='number',data=b)
     plt.xlabel('Win Type - Runs or wickets')
@@ -2185,7 +4009,7 @@ def plotWinsbyTossDecision(matches,team1,tossDecision='bat', plot=True, savePic=
     teamBowlingWicketKindOppositionAllMatches       
     '''
     df=matches.loc[(matches.tossDecision==tossDecision) & (matches.tossWinner==team1)]
-    a=df[['date','winner']].groupby(['date','winner']).count().reset_index(inplace=False)
+    a=getMatchWinners(df).groupby(['date','winner']).count().reset_index(inplace=False)
     b=a.groupby('winner').count().reset_index(inplace=False)
     b.columns = ['winner','number']
     sns.barplot(x='winner',y='number',data=b)
@@ -2207,7 +4031,7 @@ def plotWinsbyTossDecision(matches,team1,tossDecision='bat', plot=True, savePic=
 # This function gets all the matches between a IPL team and all opposition
 #
 ########################################################################################### 
-def getAllMatchesAllOpposition(team1,dir=".",save=False,odir="."):
+def getAllMatchesAllOpposition(team1,dir=".",save=False,odir=".",columns=None):
     '''
     Get data on all matches against all opposition
     
@@ -2221,7 +4045,7 @@ def getAllMatchesAllOpposition(team1,dir=".",save=False,odir="."):
     
     Usage
     
-    getAllMatchesAllOpposition(team,dir=".",save=FALSE)
+    getAllMatchesAllOpposition(team,dir=".",save=FALSE,columns=None)
     Arguments
     
     team	
@@ -2230,6 +4054,8 @@ def getAllMatchesAllOpposition(team1,dir=".",save=False,odir="."):
     The directory in which the saved .RData files exist
     save	
     Default=False. This parameter indicates whether the combined data frame needs to be saved or not. It is recommended to save this large dataframe as the creation of this data frame takes a several seconds depending on the number of matches
+    columns	
+    The list of columns to read from the matches. All columns are read if None
     Value
     
     match The combined data frame
@@ -2254,19 +4080,13 @@ def getAllMatchesAllOpposition(team1,dir=".",save=False,odir="."):
     teamBatsmenPartnershiAllOppnAllMatches  
     '''
 
-    # Create the 2 combinations
-    t1 = '*' +  team1 +'*.csv'
-    path= os.path.join(dir,t1)
-
-    
-    files = glob.glob(path) 
-    print(len(files))
+    # Get the matches played by the team from the match catalog of the directory
+    matches = findTeamMatches(dir,team1)
+    print(len(matches))
     # Save as CSV only if there are matches between the 2 teams
-    if len(files) !=0:
-        df = pd.DataFrame()
-        for file in files:
-            df1 = pd.read_csv(file)
-            df=pd.concat([df,df1])    
+    if len(matches) !=0:
+        # The categorical columns of the matches are combined
+        df = concatMatches(list(loadCatalogMatches(dir,matches,columns)))
         if save==True:
             dest= team1 + '-allMatchesAllOpposition.csv'    
             output=os.path.join(odir,dest)
@@ -2274,6 +4094,68 @@ def getAllMatchesAllOpposition(team1,dir=".",save=False,odir="."):
         else:
            return(df)
            
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: saveAllMatchesAllOppositionTeams
+# This function saves all the matches of each team against all opposition in a single pass
+#
+###########################################################################################
+
+def saveAllMatchesAllOppositionTeams(teams,dir1,odir="."):
+    '''
+    Saves the matches of each team against all opposition as dataframes
+    
+    Description
+    
+    This function saves the matches of each team of a league against all opposition in a 
+    single pass. The matches are taken from the match catalog of the directory and each match 
+    is read once. It is appended to team-allMatchesAllOpposition.csv of both its teams, so 
+    that only one match is held in memory at a time
+    
+    Usage
+    
+    saveAllMatchesAllOppositionTeams(teams,dir1,odir=".")
+    Arguments
+    
+    teams	
+    The list of teams of the league
+    dir1	
+    The directory of the converted matches
+    odir	
+    The directory in which the matches of the teams are saved
+    Value
+    
+    None
+    
+    See Also
+    
+    getAllMatchesAllOpposition
+    saveAllMatchesAllOppositionIPLT20
+    '''
+    catalog = getMatchCatalog(dir1)
+    catalog = catalog[catalog.team1.isin(teams) | catalog.team2.isin(teams)]
+    print("Matches=", len(catalog))
+    outputs = {}
+    try:
+        for match, df in zip(catalog.to_dict('records'), loadCatalogMatches(dir1, catalog)):
+            for team in (match['team1'], match['team2']):
+                if team not in teams:
+                    continue
+                if team not in outputs:
+                    print("Team=",team)
+                    dest= team + '-allMatchesAllOpposition.csv'
+                    f = open(os.path.join(odir,dest), 'w', newline='')
+                    outputs[team] = (f, list(df.columns))
+                    df.to_csv(f)
+                else:
+                    # The matches are appended with the columns of the first match of the team
+                    f, columns = outputs[team]
+                    df.reindex(columns=columns).to_csv(f, header=False)
+    finally:
+        for f, columns in outputs.values():
+            f.close()
+    return
+           
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 1 Feb 2019
@@ -2292,7 +4174,7 @@ def saveAllMatchesAllOppositionIPLT20(dir1,odir="."):
     
     Usage
     
-    saveAllMatchesAllOppositionIPLT20(dir)
+    saveAllMatchesAllOppositionIPLT20(dir1,odir=".")
     Arguments
     
     dir	
@@ -2326,10 +4208,8 @@ def saveAllMatchesAllOppositionIPLT20(dir1,odir="."):
                   "Royal Challengers Bangalore","Sunrisers Hyderabad","Gujarat Lions",
                   "Rising Pune Supergiants"]
     
-    for team in teams:
-                print("Team=",team)
-                getAllMatchesAllOpposition(team,dir=dir1,save=True,odir=odir)
-                time.sleep(2) #Sleep before  next save
+    # Each match is read once and appended to the matches of its teams
+    saveAllMatchesAllOppositionTeams(teams,dir1,odir)
                 
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -2388,11 +4268,11 @@ def teamBatsmenPartnershiAllOppnAllMatches(matches,theTeam,report="summary",top=
     df2 = df1[['batsman','non_striker','runs']]
     
     # Compute partnerships
-    df3=df2.groupby(['batsman','non_striker']).sum().reset_index(inplace=False)
+    df3=df2.groupby(['batsman','non_striker'],observed=True).sum(numeric_only=True).reset_index(inplace=False)
     df3.columns = ['batsman','non_striker','partnershipRuns']
     
     # Compute total partnerships
-    df4 = df3.groupby('batsman').sum().reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
+    df4 = df3.groupby('batsman',observed=True).sum(numeric_only=True).reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
     df4.columns = ['batsman','totalPartnershipRuns']
     
     # Select top 5
@@ -2467,11 +4347,11 @@ def teamBatsmenPartnershipAllOppnAllMatchesChart(matches,main,plot=True,top=5,pa
     df2 = df1[['batsman','non_striker','runs']]
     
     # Compute partnerships
-    df3=df2.groupby(['batsman','non_striker']).sum().reset_index(inplace=False)
+    df3=df2.groupby(['batsman','non_striker'],observed=True).sum(numeric_only=True).reset_index(inplace=False)
     df3.columns = ['batsman','non_striker','partnershipRuns']
     
     # Compute total partnerships
-    df4 = df3.groupby('batsman').sum().reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
+    df4 = df3.groupby('batsman',observed=True).sum(numeric_only=True).reset_index(inplace=False).sort_values('partnershipRuns',ascending=False)
     df4.columns = ['batsman','totalPartnershipRuns']
     
     
@@ -2483,7 +4363,7 @@ def teamBatsmenPartnershipAllOppnAllMatchesChart(matches,main,plot=True,top=5,pa
     # Remove rows where partnershipRuns < partnershipRuns as there are too many
     df8 = df7[df7['partnershipRuns'] > partnershipRuns]
     
-    df9=df8.groupby(['batsman','non_striker'])['partnershipRuns'].sum().unstack(fill_value=0)
+    df9=df8.groupby(['batsman','non_striker'],observed=True)['partnershipRuns'].sum().unstack(fill_value=0)
     # Note: Can also use the below code -*************
     #df8=df7.pivot(columns='non_striker',index='batsman').fillna(0)
  
@@ -2563,20 +4443,18 @@ def teamBatsmenVsBowlersAllOppnAllMatches(matches,main,plot=True,top=5,runsScore
     df2 = df1[['batsman','bowler','runs']]
     
     # Runs scored by bowler
-    df3=df2.groupby(['batsman','bowler']).sum().reset_index(inplace=False)
-    df3.columns = ['batsman','bowler','runsScored']
+    df3=aggregate(df2,['batsman','bowler'],{'runsScored':'runs'},sort=True)
     print(df3.shape)
     # Need to pick the 'top' number of bowlers
-    df4 = df3.groupby('batsman').sum().reset_index(inplace=False).sort_values('runsScored',ascending=False)
+    df4 = aggregate(df3,['batsman'],{'totalRunsScored':'runsScored'},sort=True).sort_values('totalRunsScored',ascending=False)
     print(df4.shape)
-    df4.columns = ['batsman','totalRunsScored']
     df5 = df4.head(top)
     df6= pd.merge(df5,df3,on='batsman')
     df7 = df6[['batsman','bowler','runsScored']]
     
     # Remove rows where runsScored < runsScored as there are too many
     df8 = df7[df7['runsScored'] >runsScored]
-    df9=df8.groupby(['batsman','bowler'])['runsScored'].sum().unstack().fillna(0)
+    df9=df8.groupby(['batsman','bowler'],observed=True)['runsScored'].sum().unstack().fillna(0)
     # Note: Can also use the below code -*************
     #df8=df7.pivot(columns='bowler',index='batsman').fillna(0)
     
@@ -2639,19 +4517,8 @@ def teamBattingScorecardAllOppnAllMatches(matches,main):
     https://gigadom.wordpress.com/    
     '''
     team=matches.loc[matches.team== main]
-    a1= getRuns(team)
-    b1= getFours(team)
-    c1= getSixes(team)
-    
-    # Merge columns
-    d1=pd.merge(a1, b1, how='outer', on='batsman')
-    e=pd.merge(d1,c1,how='outer', on='batsman')
-    e=e.fillna(0)
-    
-    e['4s']=e['4s'].astype(int)
-    e['6s']=e['6s'].astype(int)
-    e['SR']=(e['runs']/e['balls']) *100
-    scorecard = e[['batsman','runs','balls','4s','6s','SR']].sort_values('runs',ascending=False)
+    # Balls, runs, 4s, 6s and strike rate in a single groupby
+    scorecard = getBattingScorecard(team).sort_values('runs',ascending=False)
     return(scorecard)
     
 ##########################################################################################
@@ -2698,23 +4565,8 @@ def teamBowlingScorecardAllOppnAllMatches(matches,main):
     https://gigadom.wordpress.com/
     '''
     team=matches.loc[matches.team== main] 
-    # Compute overs bowled
-    a1= getOvers(team).reset_index(inplace=False)
-    # Compute runs conceded
-    b1= getRunsConceded(team).reset_index(inplace=False)   
-    # Compute maidens
-    c1= getMaidens(team).reset_index(inplace=False)   
-    # Compute wickets
-    d1= getWickets(team).reset_index(inplace=False)
-    e1=pd.merge(a1, b1, how='outer', on='bowler')
-    f1= pd.merge(e1,c1,how='outer', on='bowler')
-    g1= pd.merge(f1,d1,how='outer', on='bowler')
-    g1 = g1.fillna(0)
-    # Compute economy rate
-    g1['econrate'] = g1['runs']/g1['overs']
-    g1.columns=['bowler','overs','runs','maidens','wicket','econrate']
-    g1.maidens = g1.maidens.astype(int)
-    g1.wicket = g1.wicket.astype(int)
+    # Overs of legal deliveries, runs conceded, maidens, wickets and economy rate in a single pass
+    g1= getBowlingScorecard(team)
     g2 = g1.sort_values('wicket',ascending=False)
     return(g2)
 ##########################################################################################
@@ -2730,14 +4582,14 @@ def teamBowlingWicketKindAllOppnAllMatches(matches,main,plot=True,top=5,wickets=
     df2= df1[['bowler','kind','player_out']]
 
     # Find all rows where there was a wicket
-    df2=df2[df2.player_out != '0']
+    df2=df2[notMissing(df2.player_out)]
     
     # Number of wickets taken by bowler
-    df3=df2.groupby(['bowler','kind']).count().reset_index(inplace=False)
+    df3=df2.groupby(['bowler','kind'],observed=True).count().reset_index(inplace=False)
     df3.columns = ['bowler','kind','wickets']
     
     # Need to pick the 'top' number of bowlers by wickets
-    df4 = df3.groupby('bowler').sum().reset_index(inplace=False).sort_values('wickets',ascending=False)
+    df4 = df3.groupby('bowler',observed=True).sum(numeric_only=True).reset_index(inplace=False).sort_values('wickets',ascending=False)
     df4.columns = ['bowler','totalWickets']
     df5 = df4.head(top)
     df6= pd.merge(df5,df3,on='bowler')
@@ -2746,7 +4598,7 @@ def teamBowlingWicketKindAllOppnAllMatches(matches,main,plot=True,top=5,wickets=
     
     # Remove rows where runsScored < runsScored as there are too many
     df8 = df7[df7['wickets'] >wickets]
-    df9=df8.groupby(['bowler','kind'])['wickets'].sum().unstack().fillna(0)   
+    df9=df8.groupby(['bowler','kind'],observed=True)['wickets'].sum().unstack().fillna(0)   
     # Note: Can also use the below code -*************
     #df9=df8.pivot(columns='bowler',index='batsman').fillna(0)
 
@@ -2822,12 +4674,10 @@ def teamBowlersVsBatsmenAllOppnAllMatches(matches,main,plot=True,top=5,runsConce
     df2= df1[['bowler','batsman','runs']]
     
     # Number of wickets taken by bowler
-    df3=df2.groupby(['bowler','batsman']).sum().reset_index(inplace=False)
-    df3.columns = ['bowler','batsman','runsConceded']
+    df3=aggregate(df2,['bowler','batsman'],{'runsConceded':'runs'},sort=True)
     
     # Need to pick the 'top' number of bowlers by wickets
-    df4 = df3.groupby('bowler').sum().reset_index(inplace=False).sort_values('runsConceded',ascending=False)
-    df4.columns = ['bowler','totalRunsConceded']
+    df4 = aggregate(df3,['bowler'],{'totalRunsConceded':'runsConceded'},sort=True).sort_values('totalRunsConceded',ascending=False)
     df5 = df4.head(top)
     df6= pd.merge(df5,df3,on='bowler')
     df7 = df6[['bowler','batsman','runsConceded']]
@@ -2835,7 +4685,7 @@ def teamBowlersVsBatsmenAllOppnAllMatches(matches,main,plot=True,top=5,runsConce
     
     # Remove rows where runsScored < runsScored as there are too many
     df8 = df7[df7['runsConceded'] >runsConceded]
-    df9=df8.groupby(['bowler','batsman'])['runsConceded'].sum().unstack().fillna(0)   
+    df9=df8.groupby(['bowler','batsman'],observed=True)['runsConceded'].sum().unstack().fillna(0)   
     # Note: Can also use the below code -*************
     #df9=df8.pivot(columns='bowler',index='batsman').fillna(0)
     
@@ -2904,7 +4754,7 @@ def plotWinLossByTeamAllOpposition(matches, team1, plot='summary',savePic=False,
     http://cricsheet.org/
     https://gigadom.wordpress.com/
     '''
-    a=matches[['date','winner']].groupby(['date','winner']).count().reset_index(inplace=False)
+    a=getMatchWinners(matches).groupby(['date','winner']).count().reset_index(inplace=False)
     # Plot the overall performance as wins and losses
     if plot=="summary":
         m= a.loc[a.winner==team1]['winner'].count()
@@ -2922,8 +4772,6 @@ def plotWinLossByTeamAllOpposition(matches, team1, plot='summary',savePic=False,
     elif plot=="detailed" : 
         #Plot breakup by team
         b=a.groupby('winner').count().reset_index(inplace=False)
-        # If 'winner' is '0' then the match is a tie.Set as 'tie'
-        b.loc[b.winner=='0','winner']='Tie'
         b.columns = ['winner','number']
         ax=sns.barplot(x='winner',y='number',data=b)
         plt.xlabel('Winner')
@@ -2990,8 +4838,8 @@ def plotWinsByRunOrWicketsAllOpposition(matches,team1,plot=True, savePic=False,
     '''
     # Get the number of matches won
     df= matches.loc[matches.winner == team1]
-    a=df[['date','winType']].groupby(['date','winType']).count().reset_index(inplace=False)
-    b=a.groupby('winType').count().reset_index(inplace=False)
+    a=df[['date','winType']].groupby(['date','winType'],observed=True).count().reset_index(inplace=False)
+    b=a.groupby('winType',observed=True).count().reset_index(inplace=False)
     b.columns = ['winType','number']
     sns.barplot(x='winType',y='number',data=b)
     plt.xlabel('Win Type - Runs or wickets')
@@ -3064,7 +4912,7 @@ def plotWinsbyTossDecisionAllOpposition(matches,team1,tossDecision='bat',plot="s
     '''    
 
     df=matches.loc[(matches.tossDecision==tossDecision) & (matches.tossWinner==team1)]
-    a=df[['date','winner']].groupby(['date','winner']).count().reset_index(inplace=False)
+    a=getMatchWinners(df).groupby(['date','winner']).count().reset_index(inplace=False)
     
     if plot=="summary":
         m= a.loc[a.winner==team1]['winner'].count()
@@ -3082,8 +4930,6 @@ def plotWinsbyTossDecisionAllOpposition(matches,team1,tossDecision='bat',plot="s
     elif plot=="detailed" : 
         #Plot breakup by team        
         b=a.groupby('winner').count().reset_index(inplace=False)
-        # If 'winner' is '0' then the match is a tie.Set as 'tie'
-        b.loc[b.winner=='0','winner']='Tie'
         b.columns = ['winner','number']
         ax=sns.barplot(x='winner',y='number',data=b)
         plt.xlabel(team1 + ' chose to ' + tossDecision)
@@ -3098,6 +4944,87 @@ def plotWinsbyTossDecisionAllOpposition(matches,team1,tossDecision='bat',plot="s
         plt.gcf().clear()
         return
 
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchBattingDetails
+# This function gets the batting details of a team in a match
+#
+###########################################################################################
+
+def getMatchBattingDetails(match, team):
+    '''
+    Get the batting details of team in a match loaded with battingDetailsColumns. None is 
+    returned if the team did not bat or lost no wickets
+    '''
+    scorecard,extras=teamBattingScorecardMatch(match,team)
+    if scorecard.empty:
+        return(None)
+    # Filter out only the rows played by team
+    match1 = match.loc[match.team==team]
+    if len(match1) == 0:
+        return(None)
+
+    # Check if there were wickets, you will 'bowled', 'caught' etc
+    b=match1.loc[notMissing(match1.kind)]
+    if len(b) == 0:
+        return(None)
+
+    # Get the details of the wicket
+    wkts= b[['batsman','bowler','fielders','kind','player_out']].astype(object)
+    df=pd.merge(scorecard,wkts,how='outer',on='batsman',indicator=True)
+
+    # Fill NA as not outs. The fielders of a wicket like bowled stay null
+    out = df.pop('_merge') == 'both'
+    fielders = df['fielders']
+    df =df.fillna('notOut')
+    df['fielders'] = df['fielders'].where(~out, fielders)
+
+    # Set other info
+    df['date']= b['date'].iloc[0]
+    df['team2']= b['team2'].iloc[0]
+    df['winner']= b['winner'].iloc[0]
+    df['result']= b['result'].iloc[0]
+    df['venue']= b['venue'].iloc[0]
+    return(df)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getTeamMatchDetails
+# This function loads a match of the catalog and gets the details of a team in it
+#
+###########################################################################################
+
+def getTeamMatchDetails(getDetails, team, dir, match, columns):
+    '''
+    Load a match of the catalog of dir and get the details of team in it with getDetails, 
+    which is getMatchBattingDetails or getMatchBowlingDetails. This is run in the worker 
+    processes of getTeamBattingDetails() and getTeamBowlingDetails()
+    '''
+    df = next(loadCatalogMatches(dir, pd.DataFrame([match]), columns))
+    return(getDetails(df, team))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getAllMatchDetails
+# This function gets the details of a team in each of its matches
+#
+###########################################################################################
+
+def getAllMatchDetails(getDetails, team, dir, matches, columns, workers=1, chunksize=8):
+    '''
+    Get the details of team in each of the matches found with findTeamMatches(). If 
+    workers > 1 the matches are handed to a process pool in chunks. The results come back in
+    the order of the matches, so the details are the same as with a single process
+    '''
+    if workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(getTeamMatchDetails, repeat(getDetails), repeat(team),
+                                      repeat(dir), matches.to_dict('records'), repeat(columns),
+                                      chunksize=chunksize))
+    else:
+        parts = [getDetails(match, team) for match in loadCatalogMatches(dir,matches,columns)]
+    return([part for part in parts if part is not None])
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 24 Feb 2019
@@ -3107,7 +5034,7 @@ def plotWinsbyTossDecisionAllOpposition(matches,team1,tossDecision='bat',plot="s
 #
 ###########################################################################################        
         
-def getTeamBattingDetails(team,dir=".",save=False,odir="."):
+def getTeamBattingDetails(team,dir=".",save=False,odir=".",workers=1,chunksize=8):
     '''
     Description
     
@@ -3115,7 +5042,7 @@ def getTeamBattingDetails(team,dir=".",save=False,odir="."):
     
     Usage
     
-    getTeamBattingDetails(team,dir=".",save=FALSE)
+    getTeamBattingDetails(team,dir=".",save=FALSE,odir=".",workers=1,chunksize=8)
     Arguments
     
     team	
@@ -3124,6 +5051,13 @@ def getTeamBattingDetails(team,dir=".",save=False,odir="."):
     The source directory of RData files obtained with convertAllYaml2RDataframes()
     save	
     Whether the data frame needs to be saved as RData or not. It is recommended to set save=TRUE as the data can be used for a lot of analyses of batsmen
+    odir	
+    The directory in which the details are saved
+    workers	
+    The number of worker processes. If workers > 1 the matches are processed in a process pool.
+    The details are the same as with a single process
+    chunksize	
+    The number of matches handed to a worker process at a time when workers > 1
     Value
     
     battingDetails The dataframe with the batting details
@@ -3143,51 +5077,20 @@ def getTeamBattingDetails(team,dir=".",save=False,odir="."):
     
     Examples  
     m=getTeamBattingDetails(team1,dir1,save=True)
+    # Get the batting details with 4 worker processes
+    m=getTeamBattingDetails(team1,dir1,workers=4)
     '''
     
-    # Get all matches played by team
-    t1 = '*' +  team +'*.csv'
-    path= os.path.join(dir,t1)
-    files = glob.glob(path) 
+    # Get all matches played by team from the match catalog of the directory
+    matches = findTeamMatches(dir,team)
 
     
-    # Create an empty dataframe
-    details = pd.DataFrame()
-    
-    # Loop through all matches played by team
-    for file in files:
-          match=pd.read_csv(file)
-        
-          
-          scorecard,extras=teamBattingScorecardMatch(match,team)
-          if scorecard.empty:
-               continue
-          # Filter out only the rows played by team
-          match1 = match.loc[match.team==team]
-       
-          # Check if there were wickets, you will 'bowled', 'caught' etc
-          if len(match1 !=0):
-            if isinstance(match1.kind.iloc[0],str):
-              b=match1.loc[match1.kind != '0']
-          
-              # Get the details of the wicket
-              wkts= b[['batsman','bowler','fielders','kind','player_out']]
-              #date','team2','winner','result','venue']]
-              df=pd.merge(scorecard,wkts,how='outer',on='batsman')
-              
-              # Fill NA as not outs
-              df =df.fillna('notOut')
-              
-              # Set other info
-              if len(b) != 0:
-                  df['date']= b['date'].iloc[0]
-                  df['team2']= b['team2'].iloc[0]
-                  df['winner']= b['winner'].iloc[0]
-                  df['result']= b['result'].iloc[0]
-                  df['venue']= b['venue'].iloc[0]         
-                  details= pd.concat([details,df])
-                  details = details.sort_values(['batsman','date'])      
+    # The details of each match are collected and combined at the end. Only the columns 
+    # needed are read
+    parts = getAllMatchDetails(getMatchBattingDetails,team,dir,matches,battingDetailsColumns,
+                               workers,chunksize)
  
+    details = combineDetails(parts, ['batsman','date'])
     if save==True:
               fileName = "./" + team + "-BattingDetails.csv"
               output=os.path.join(odir,fileName)
@@ -4011,25 +5914,35 @@ def batsmanRunsVenue(df,name= "A Leg Glance",plot=True, savePic=False, dir1=".",
 ###########################################################################################  
 def teamBowlingPerDetails(team):
 
-    # Compute overs bowled
-    a1= getOvers(team).reset_index(inplace=False)
-    # Compute runs conceded
-    b1= getRunsConceded(team).reset_index(inplace=False)   
-    # Compute maidens
-    c1= getMaidens(team).reset_index(inplace=False)   
-    # Compute wickets
-    d1= getWickets(team).reset_index(inplace=False)
-    e1=pd.merge(a1, b1, how='outer', on='bowler')
-    f1= pd.merge(e1,c1,how='outer', on='bowler')
-    g1= pd.merge(f1,d1,how='outer', on='bowler')
-    g1 = g1.fillna(0)
-    # Compute economy rate
-    g1['econrate'] = g1['runs']/g1['overs']
-    g1.columns=['bowler','overs','runs','maidens','wicket','econrate']
-    g1.maidens = g1.maidens.astype(int)
-    g1.wicket = g1.wicket.astype(int)
+    # Overs of legal deliveries, runs conceded, maidens, wickets and economy rate in a single pass
+    g1= getBowlingScorecard(team)
     return(g1)
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchBowlingDetails
+# This function gets the bowling details of a team in a match
+#
+###########################################################################################
+
+def getMatchBowlingDetails(match, team):
+    '''
+    Get the bowling details of team in a match loaded with bowlingDetailsColumns. None is 
+    returned if the team did not bowl
+    '''
+    if(match.size == 0):
+        return(None)
+    team1=match.loc[match.team != team]
+    if len(team1) == 0:
+        return(None) # The team did not bowl
+    scorecard=teamBowlingPerDetails(team1)
+    scorecard['date']= match['date'].iloc[0]
+    scorecard['team2']= match['team2'].iloc[0]
+    scorecard['winner']= match['winner'].iloc[0]
+    scorecard['result']= match['result'].iloc[0]
+    scorecard['venue']= match['venue'].iloc[0]
+    return(scorecard)
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 24 Feb 2019
@@ -4038,7 +5951,7 @@ def teamBowlingPerDetails(team):
 # 
 #
 ###########################################################################################  
-def getTeamBowlingDetails (team,dir=".",save=False,odir="."):
+def getTeamBowlingDetails (team,dir=".",save=False,odir=".",workers=1,chunksize=8):
     '''
     Description
     
@@ -4046,7 +5959,7 @@ def getTeamBowlingDetails (team,dir=".",save=False,odir="."):
     
     Usage
     
-    getTeamBowlingDetails(team,dir=".",save=FALSE)
+    getTeamBowlingDetails(team,dir=".",save=FALSE,odir=".",workers=1,chunksize=8)
     Arguments
     
     team	
@@ -4055,6 +5968,13 @@ def getTeamBowlingDetails (team,dir=".",save=False,odir="."):
     The source directory of RData files obtained with convertAllYaml2RDataframes()
     save	
     Whether the data frame needs to be saved as RData or not. It is recommended to set save=TRUE as the data can be used for a lot of analyses of batsmen
+    odir	
+    The directory in which the details are saved
+    workers	
+    The number of worker processes. If workers > 1 the matches are processed in a process pool.
+    The details are the same as with a single process
+    chunksize	
+    The number of matches handed to a worker process at a time when workers > 1
     Value
     
     bowlingDetails The dataframe with the bowling details
@@ -4083,36 +6003,19 @@ def getTeamBowlingDetails (team,dir=".",save=False,odir="."):
     dir1= "C:\\software\\cricket-package\\yorkpyIPLData\\data"
     eam1='Delhi Daredevils'
     m=getTeamBowlingDetails(team1,dir1,save=True)
+    # Get the bowling details with 4 worker processes
+    m=getTeamBowlingDetails(team1,dir1,workers=4)
     '''
     
-    # Get all matches played by team
-    t1 = '*' +  team +'*.csv'
-    path= os.path.join(dir,t1)
-    files = glob.glob(path) 
+    # Get all matches played by team from the match catalog of the directory
+    matches = findTeamMatches(dir,team)
 
     
-    # Create an empty dataframe
-    details = pd.DataFrame()
-    
-    # Loop through all matches played by team
-    for file in files:
-          match=pd.read_csv(file)
-          if(match.size != 0):
-              team1=match.loc[match.team != team]
-          else:
-              continue
-
-          if len(team1) !=0:
-              scorecard=teamBowlingPerDetails(team1)
-              scorecard['date']= match['date'].iloc[0]
-              scorecard['team2']= match['team2'].iloc[0]
-              scorecard['winner']= match['winner'].iloc[0]
-              scorecard['result']= match['result'].iloc[0]
-              scorecard['venue']= match['venue'].iloc[0]       
-              details= pd.concat([details,scorecard])
-              details = details.sort_values(['bowler','date'])
-          else:
-              pass # The team did not bowl
+    # The details of each match are collected and combined at the end. Only the columns 
+    # needed are read
+    parts = getAllMatchDetails(getMatchBowlingDetails,team,dir,matches,bowlingDetailsColumns,
+                               workers,chunksize)
+    details = combineDetails(parts, ['bowler','date'])
     if save==True:
          fileName = "./" + team + "-BowlingDetails.csv"
          output=os.path.join(odir,fileName)
@@ -4120,6 +6023,97 @@ def getTeamBowlingDetails (team,dir=".",save=False,odir="."):
               
     return(details)
     
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getCatalogTeamDetails
+# This function gets the batting and bowling details of both teams of each match
+#
+###########################################################################################  
+def getCatalogTeamDetails(dir, catalog, teams=None):
+    '''
+    Get the batting and bowling details of both teams in each match of the catalog. Each match 
+    is read once and (match, team, battingDetails, bowlingDetails) is yielded for each of its
+    teams which is in teams. The details are None if the team did not bat or bowl
+    '''
+    for match, df in zip(catalog.to_dict('records'), loadCatalogMatches(dir,catalog,teamDetailsColumns)):
+        for team in (match['team1'], match['team2']):
+            if teams is not None and team not in teams:
+                continue
+            yield(match, team, getMatchBattingDetails(df, team), getMatchBowlingDetails(df, team))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: buildAllTeamDetails
+# This function builds the batting and bowling details of all teams in a single pass
+#
+###########################################################################################  
+def buildAllTeamDetails(dir=".",save=True,odir=".",teams=None):
+    '''
+    Build the batting and bowling details of all teams
+    
+    Description
+    
+    This function builds the batting and bowling details of every team in the matches of a 
+    directory in a single pass. Each match is read once and the details of both its teams 
+    are taken from it. The details of each team are the same as those of 
+    getTeamBattingDetails() and getTeamBowlingDetails()
+    
+    Usage
+    
+    buildAllTeamDetails(dir=".",save=True,odir=".",teams=None)
+    Arguments
+    
+    dir	
+    The source directory of the converted matches
+    save	
+    If save=True the details are saved as team-BattingDetails.csv and team-BowlingDetails.csv 
+    for each team
+    odir	
+    The directory in which the details are saved
+    teams	
+    The list of teams for which the details are built e.g. the teams of a league. The details 
+    of all the teams are built if None
+    Value
+    
+    battingDetails, bowlingDetails The dictionaries of the batting and bowling details of 
+    each team
+    
+    References
+    
+    http://cricsheet.org/
+    https://gigadom.in/
+    
+    See Also
+    
+    getTeamBattingDetails
+    getTeamBowlingDetails
+    Examples
+    batting,bowling=buildAllTeamDetails("../data",odir="../details")
+    batting["Chennai Super Kings"]
+    '''
+    catalog = getMatchCatalog(dir)
+    if teams is not None:
+        catalog = catalog[catalog.team1.isin(teams) | catalog.team2.isin(teams)]
+    print("Matches=", len(catalog))
+
+    # The details of each match are collected for each team and combined at the end
+    battingParts = {}
+    bowlingParts = {}
+    for match, team, batting, bowling in getCatalogTeamDetails(dir, catalog, teams):
+        if batting is not None:
+            battingParts.setdefault(team, []).append(batting)
+        if bowling is not None:
+            bowlingParts.setdefault(team, []).append(bowling)
+
+    battingDetails = {team: combineDetails(parts, ['batsman','date']) for team, parts in battingParts.items()}
+    bowlingDetails = {team: combineDetails(parts, ['bowler','date']) for team, parts in bowlingParts.items()}
+    if save==True:
+        for team, details in battingDetails.items():
+            details.to_csv(os.path.join(odir, team + "-BattingDetails.csv"))
+        for team, details in bowlingDetails.items():
+            details.to_csv(os.path.join(odir, team + "-BowlingDetails.csv"),index=False)
+    return(battingDetails, bowlingDetails)
+    
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 24 Feb 2019
@@ -4832,7 +6826,7 @@ def saveAllMatchesBetween2IntlT20s(dir1,odir="."):
     
     Usage
     
-    saveAllMatchesBetween2IntlT20s(dir)
+    saveAllMatchesBetween2IntlT20s(dir1,odir=".")
     Arguments
     
     dir	
@@ -4864,12 +6858,8 @@ def saveAllMatchesBetween2IntlT20s(dir1,odir="."):
              "New Zealand", "Oman","Pakistan","Scotland","South Africa",
              "Sri Lanka", "United Arab Emirates","West Indies", "Zimbabwe"]
     
-    for team1 in teams:
-        for team2 in teams:
-            if team1 != team2:
-                print("Team1=",team1,"team2=", team2)
-                getAllMatchesBetweenTeams(team1,team2,dir=dir1,save=True,odir=odir)
-                time.sleep(2) #Sleep before  next save   
+    # Each match is read once and saved once for its pair of teams
+    saveAllMatchesBetweenTeamPairs(teams,dir1,odir)
                 
     return    
 
@@ -4894,7 +6884,7 @@ def saveAllMatchesAllOppositionIntlT20(dir1,odir="."):
     
     Usage
     
-    saveAllMatchesAllOppositionIntlT20(dir)
+    saveAllMatchesAllOppositionIntlT20(dir1,odir=".")
     Arguments
     
     dir	
@@ -4927,10 +6917,8 @@ def saveAllMatchesAllOppositionIntlT20(dir1,odir="."):
              "New Zealand", "Oman","Pakistan","Scotland","South Africa",
              "Sri Lanka", "United Arab Emirates","West Indies", "Zimbabwe"]
     
-    for team in teams:
-                print("Team=",team)
-                getAllMatchesAllOpposition(team,dir=dir1,save=True,odir=odir)
-                time.sleep(2) #Sleep before  next save
+    # Each match is read once and appended to the matches of its teams
+    saveAllMatchesAllOppositionTeams(teams,dir1,odir)
                    
 
 ##########################################################################################
@@ -4941,7 +6929,7 @@ def saveAllMatchesAllOppositionIntlT20(dir1,odir="."):
 #
 ###########################################################################################
 
-def saveAllMatchesBetween2BBLTeams(dir1):  
+def saveAllMatchesBetween2BBLTeams(dir1,odir="."):
     '''
     Saves all matches between 2 BBLteams as dataframe
     Description
@@ -4951,7 +6939,7 @@ def saveAllMatchesBetween2BBLTeams(dir1):
     
     Usage
     
-    saveAllMatchesBetween2BBLTeams(dir)
+    saveAllMatchesBetween2BBLTeams(dir1,odir=".")
     Arguments
     
     dir	
@@ -4982,12 +6970,8 @@ def saveAllMatchesBetween2BBLTeams(dir1):
              "Melbourne Renegades", "Perth Scorchers", "Sydney Sixers",
              "Sydney Thunder"]
     
-    for team1 in teams:
-        for team2 in teams:
-            if team1 != team2:
-                print("Team1=",team1,"team2=", team2)
-                getAllMatchesBetweenTeams(team1,team2,dir=dir1,save=True)
-                time.sleep(2) #Sleep before  next save   
+    # Each match is read once and saved once for its pair of teams
+    saveAllMatchesBetweenTeamPairs(teams,dir1,odir)
                 
     return    
 
@@ -4998,7 +6982,7 @@ def saveAllMatchesBetween2BBLTeams(dir1):
 # This function saves all the matches between all BBL T20 teams
 #
 ########################################################################################### 
-def saveAllMatchesAllOppositionBBLT20(dir1):  
+def saveAllMatchesAllOppositionBBLT20(dir1,odir="."):  
     '''
     Saves matches against all BBL T20 teams as dataframe and CSV for an IPL team
     
@@ -5009,7 +6993,7 @@ def saveAllMatchesAllOppositionBBLT20(dir1):
     
     Usage
     
-    saveAllMatchesAllOppositionBBLT20(dir)
+    saveAllMatchesAllOppositionBBLT20(dir1,odir=".")
     Arguments
     
     dir	
@@ -5041,10 +7025,8 @@ def saveAllMatchesAllOppositionBBLT20(dir1):
              "Melbourne Renegades", "Perth Scorchers", "Sydney Sixers",
              "Sydney Thunder"]
     
-    for team in teams:
-                print("Team=",team)
-                getAllMatchesAllOpposition(team,dir=dir1,save=True)
-                time.sleep(2) #Sleep before  next save
+    # Each match is read once and appended to the matches of its teams
+    saveAllMatchesAllOppositionTeams(teams,dir1,odir)
                 
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -5054,7 +7036,7 @@ def saveAllMatchesAllOppositionBBLT20(dir1):
 #
 ###########################################################################################
 
-def saveAllMatchesBetween2NWBTeams(dir1):  
+def saveAllMatchesBetween2NWBTeams(dir1,odir="."):
     '''
     Saves all matches between 2 NWB teams as dataframe
     Description
@@ -5064,7 +7046,7 @@ def saveAllMatchesBetween2NWBTeams(dir1):
     
     Usage
     
-    saveAllMatchesBetween2NWBTeams(dir)
+    saveAllMatchesBetween2NWBTeams(dir1,odir=".")
     Arguments
     
     dir	
@@ -5097,12 +7079,8 @@ def saveAllMatchesBetween2NWBTeams(dir1):
              "Nottinghamshire","Somerset","Surrey","Sussex","Warwickshire",
              "Worcestershire","Yorkshire"]
     
-    for team1 in teams:
-        for team2 in teams:
-            if team1 != team2:
-                print("Team1=",team1,"team2=", team2)
-                getAllMatchesBetweenTeams(team1,team2,dir=dir1,save=True)
-                time.sleep(2) #Sleep before  next save   
+    # Each match is read once and saved once for its pair of teams
+    saveAllMatchesBetweenTeamPairs(teams,dir1,odir)
                 
     return   
 
@@ -5113,7 +7091,7 @@ def saveAllMatchesBetween2NWBTeams(dir1):
 # This function saves all the matches between all NWB T20 teams
 #
 ########################################################################################### 
-def saveAllMatchesAllOppositionNWBT20(dir1):  
+def saveAllMatchesAllOppositionNWBT20(dir1,odir="."):  
     '''
     Saves matches against all NWB T20 teams as dataframe and CSV for an IPL team
     
@@ -5124,7 +7102,7 @@ def saveAllMatchesAllOppositionNWBT20(dir1):
     
     Usage
     
-    saveAllMatchesAllOppositionNWBT20(dir)
+    saveAllMatchesAllOppositionNWBT20(dir1,odir=".")
     Arguments
     
     dir	
@@ -5158,11 +7136,657 @@ def saveAllMatchesAllOppositionNWBT20(dir1):
              "Nottinghamshire","Somerset","Surrey","Sussex","Warwickshire",
              "Worcestershire","Yorkshire"]
     
-    for team in teams:
-                print("Team=",team)
-                getAllMatchesAllOpposition(team,dir=dir1,save=True)
-                time.sleep(2) #Sleep before  next save
+    # Each match is read once and appended to the matches of its teams
+    saveAllMatchesAllOppositionTeams(teams,dir1,odir)
                 
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getCatalogPlayerRows
+# This function gets the rows of the player-match tables for matches of the catalog
+#
+###########################################################################################
+def getCatalogPlayerRows(dir, catalog):
+    '''
+    Get the rows of the batting, bowling and dismissal player-match tables for the matches of 
+    a catalog, i.e. the details of both teams of each match, and the dismissals of the match, 
+    with the team and the match_id of each row
+    '''
+    rows = {kind: [] for kind in playerMatchTables}
+    for match, df in zip(catalog.to_dict('records'), loadCatalogMatches(dir,catalog,teamDetailsColumns)):
+        for team in (match['team1'], match['team2']):
+            battingDetails = getMatchBattingDetails(df, team)
+            if battingDetails is not None:
+                rows['batting'].append(battingDetails.assign(team=team, match_id=match['match_id']))
+            bowlingDetails = getMatchBowlingDetails(df, team)
+            if bowlingDetails is not None:
+                rows['bowling'].append(bowlingDetails.assign(team=team, match_id=match['match_id']))
+        # The fielders are parsed once, when the match is added to the tables
+        dismissals = getDismissals(df.assign(team1=match['team1'], team2=match['team2']))
+        rows['dismissals'].append(dismissals.assign(match_id=match['match_id']))
+    return({kind: combineDetails(parts) for kind, parts in rows.items()})
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getPlayerTotals
+# This function gets the running totals of each player and team in player-match rows
+#
+###########################################################################################
+def getPlayerTotals(table, kind):
+    '''
+    Get the totals of each player and team in rows of a player-match table. These are the 
+    count and the sum of each averaged column of the ranking e.g. runs_count, runs_sum, 
+    SR_count and SR_sum for batting. Nulls are not counted, like in the mean of the column
+    '''
+    player, count, values = rankingColumns[kind]
+    columns = [value + suffix for value in values for suffix in ('_count', '_sum')]
+    if len(table) == 0:
+        index = pd.MultiIndex.from_arrays([[], []], names=[player, 'team'])
+        return(pd.DataFrame(columns=columns, index=index))
+    keys = [table[player].astype(str), table['team'].astype(str)]
+    g = table.groupby(keys)[values]
+    totals = pd.concat([g.count().add_suffix('_count'), g.sum().add_suffix('_sum')], axis=1)
+    return(totals[columns])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: sumPlayerTotals
+# This function sums the totals appended for each player and team
+#
+###########################################################################################
+def sumPlayerTotals(totals, kind):
+    '''
+    Sum the rows of the totals file of the players, which has a row for each player and team 
+    for every update that added or removed their matches. The players whose matches have all
+    been removed are dropped
+    '''
+    player, count, values = rankingColumns[kind]
+    totals = totals.groupby(level=[0, 1], sort=False).sum()
+    return(totals[totals[count + '_count'] > 0])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: buildPlayerMatchTables
+# This function builds the player-match tables of the matches in a directory
+#
+###########################################################################################
+def buildPlayerMatchTables(dir):
+    '''
+    Build the batting and bowling player-match tables, and the totals of the players, from 
+    all the matches in a directory and save them in the directory. The tables have the details
+    of getTeamBattingDetails() and getTeamBowlingDetails() for all the teams, with the team 
+    and the match_id of each row. The dismissal table of getDismissals() is built with them
+    '''
+    catalog = getMatchCatalog(dir)
+    print("Matches=", len(catalog))
+    stamps = getMatchStamps(dir, catalog)
+    tables = getCatalogPlayerRows(dir, catalog)
+    for kind, table in tables.items():
+        savePlayerFile(dir, playerMatchTables[kind], table, index=False)
+        if kind in playerMatchTotals:
+            savePlayerFile(dir, playerMatchTotals[kind], getPlayerTotals(table, kind))
+    savePlayerTablesIndex(dir, stamps)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: updatePlayerMatchTables
+# This function updates the player-match tables of a directory with the new matches
+#
+###########################################################################################
+def updatePlayerMatchTables(dir):
+    '''
+    Update the player-match tables and the totals of the players in a directory
+    
+    Description
+    
+    This function brings the player-match tables and the totals of the players up to date 
+    with the catalog of the directory. Only the matches which were converted, converted again
+    or removed since the last update are read, and the totals of their players are appended to
+    the totals of the directory. A match whose converted file has changed is removed from the 
+    tables and added again. The tables are built from all the matches if the directory has 
+    none, or if an earlier update did not finish. The converters update the tables of a 
+    directory which has them
+    
+    Usage
+    
+    updatePlayerMatchTables(dir)
+    Arguments
+    
+    dir	
+    The directory of the converted matches
+    Value
+    
+    None
+    
+    See Also
+    
+    buildPlayerMatchTables
+    rankPlayers
+    Examples
+    
+    # Build the tables. The tables are then updated by the converters
+    updatePlayerMatchTables("../data")
+    convertAllYaml2PandasDataframesT20("../yamldir","../data",incremental=True)
+    rankIPLT20Batting("../data")
+    '''
+    index = loadPlayerTablesIndex(dir)
+    # The tables are also built if one of them is missing e.g. the dismissal table of a 
+    # directory whose tables were built before it was added
+    files = list(playerMatchTables.values()) + list(playerMatchTotals.values())
+    # An index without the stamps of the matches was saved by an earlier version and is rebuilt
+    if (index is None or index.get('updating') or not isinstance(index['matches'], dict) or
+            not all(os.path.exists(os.path.join(dir, file)) for file in files)):
+        buildPlayerMatchTables(dir)
+        return
+    catalog = getMatchCatalog(dir)
+    stamps = getMatchStamps(dir, catalog)
+    done = index['matches']
+    # A match converted again is removed with its old rows and added with the new ones
+    changed = set(id for id, stamp in stamps.items() if id in done and done[id] != stamp)
+    added = catalog[~catalog.match_id.isin(done) | catalog.match_id.isin(changed)]
+    removed = (set(done) - set(stamps)) | changed
+    if len(added) == 0 and len(removed) == 0:
+        return
+    print("Matches added=", len(added) - len(changed), "changed=", len(changed), 
+          "removed=", len(removed) - len(changed))
+
+    # The update is marked in the index, so that the tables are rebuilt if it does not finish
+    savePlayerTablesIndex(dir, done, updating=True)
+    new = getCatalogPlayerRows(dir, added)
+    for kind in playerMatchTables:
+        # The totals of the players of the removed matches are subtracted, and the totals of 
+        # the players of the new matches are added
+        changes = []
+        # Only the header of the table is read, unless the rows of matches are removed
+        columns = getPlayerFileColumns(dir, playerMatchTables[kind])
+        if len(removed) != 0 or len(columns) == 0:
+            table = loadPlayerFile(dir, playerMatchTables[kind])
+            if len(table) != 0:
+                old = table.match_id.isin(list(removed))
+                changes.append(table[old])
+                table = table[~old]
+            savePlayerFile(dir, playerMatchTables[kind], combineDetails([table, new[kind]]), index=False)
+        elif len(new[kind]) != 0:
+            # The rows of the new matches are appended to the table
+            path = os.path.join(dir, playerMatchTables[kind])
+            new[kind].reindex(columns=columns).to_csv(path, mode='a', header=False, index=False)
+        # The dismissal table has no totals
+        if kind in playerMatchTotals:
+            totals = [-getPlayerTotals(rows, kind) for rows in changes if len(rows) != 0]
+            if len(new[kind]) != 0:
+                totals.append(getPlayerTotals(new[kind], kind))
+            if len(totals) != 0:
+                path = os.path.join(dir, playerMatchTotals[kind])
+                pd.concat(totals).to_csv(path, mode='a', header=False)
+    savePlayerTablesIndex(dir, stamps)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: savePlayerFile
+# This function saves a player-match table or the totals of the players in a directory
+#
+###########################################################################################
+def savePlayerFile(dir, file, df, index=True):
+    path = os.path.join(dir, file)
+    # Write to a temporary file and then replace, so that the file is never left half written
+    df.to_csv(path + '.tmp', index=index)
+    os.replace(path + '.tmp', path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadPlayerFile
+# This function loads a player-match table or the totals of the players of a directory
+#
+###########################################################################################
+def loadPlayerFile(dir, file):
+    '''
+    Load a player-match table or the totals of the players of a directory. A file which is 
+    loaded is kept in memory until it changes. The totals appended for each player are summed,
+    and the totals file is saved with the sums when it has grown to twice their size
+    '''
+    path = os.path.abspath(os.path.join(dir, file))
+    stat = os.stat(path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = loadedPlayerTables.get(path)
+    if cached is None or cached[0] != stamp:
+        if file in playerMatchTotals.values():
+            kind = [kind for kind, totals in playerMatchTotals.items() if totals == file][0]
+            rows = pd.read_csv(path, index_col=[0, 1])
+            df = sumPlayerTotals(rows, kind)
+            if len(rows) > 2 * max(len(df), 1):
+                savePlayerFile(dir, file, df)
+                stat = os.stat(path)
+                stamp = (stat.st_size, stat.st_mtime_ns)
+        elif stat.st_size > 1:
+            df = pd.read_csv(path, dtype={'match_id': str})
+        else:
+            # An empty table is saved without columns
+            df = pd.DataFrame()
+        cached = (stamp, df)
+        loadedPlayerTables[path] = cached
+    return(cached[1])
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getPlayerFileColumns
+# This function gets the columns of a player-match table of a directory
+#
+###########################################################################################
+def getPlayerFileColumns(dir, file):
+    '''
+    Get the columns of a player-match table from the header of its file, without reading the
+    rows. A table which was saved empty has no columns
+    '''
+    path = os.path.join(dir, file)
+    if os.path.getsize(path) <= 1:
+        return([])
+    return(list(pd.read_csv(path, nrows=0).columns))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getMatchStamps
+# This function gets the stamp of the converted file of each match in a catalog
+#
+###########################################################################################
+def getMatchStamps(dir, catalog):
+    '''
+    Get the stamp of each match of a catalog, keyed by match id. The stamp of a converted file 
+    is its size and mtime, as in the manifest of the conversion. A match of the delivery store 
+    is stamped with its part and row group, since a match which is stored again is written to
+    a new part
+    '''
+    stamps = {}
+    index = None
+    for match in catalog[['match_id', 'file']].to_dict('records'):
+        if match['file'] == deliveryStoreIndex:
+            if index is None:
+                index = loadDeliveryStoreIndex(dir)
+            entry = index[match['match_id']]
+            stamps[match['match_id']] = '%s:%s' % (entry['part'], entry['rowGroup'])
+        else:
+            stat = os.stat(os.path.join(dir, match['file']))
+            stamps[match['match_id']] = '%d:%d' % (stat.st_size, stat.st_mtime_ns)
+    return(stamps)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: savePlayerTablesIndex
+# This function saves the match ids and stamps of the player-match tables of a directory
+#
+###########################################################################################
+def savePlayerTablesIndex(dir, stamps, updating=False):
+    path = os.path.join(dir, playerTablesIndex)
+    index = {'matches': dict(sorted(stamps.items()))}
+    if updating:
+        index['updating'] = True
+    with open(path + '.tmp', 'w') as f:
+        json.dump(index, f, indent=1)
+    os.replace(path + '.tmp', path)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: loadPlayerTablesIndex
+# This function loads the index of the player-match tables of a directory
+#
+###########################################################################################
+def loadPlayerTablesIndex(dir):
+    path = os.path.join(dir, playerTablesIndex)
+    if not os.path.exists(path):
+        return(None)
+    with open(path) as f:
+        return(json.load(f))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getPlayerMatchTable
+# This function gets the batting or bowling player-match table of a directory
+#
+###########################################################################################
+def getPlayerMatchTable(dir, kind='batting'):
+    '''
+    Get the player-match table of the matches in a directory
+    
+    Description
+    
+    This function returns the batting or bowling details of all the teams in the matches of a 
+    directory, with one row per player and match, or the dismissals of the matches with one 
+    row per fielder. The tables are kept in the directory and are
+    updated with updatePlayerMatchTables() when the matches in the catalog of the directory 
+    change. A table which is loaded is kept in memory until its file changes
+    
+    Usage
+    
+    getPlayerMatchTable(dir,kind='batting')
+    Arguments
+    
+    dir	
+    The directory of the converted matches
+    kind
+    'batting', 'bowling' or 'dismissals'
+    Value
+    
+    table The data frame with the details of getTeamBattingDetails() or getTeamBowlingDetails()
+    and the team and match_id of each row, or the dismissals of getDismissals()
+    
+    See Also
+    
+    rankPlayers
+    rankFielders
+    buildAllTeamDetails
+    '''
+    if kind not in playerMatchTables:
+        raise ValueError("kind must be 'batting', 'bowling' or 'dismissals' : %s" % kind)
+    updatePlayerMatchTables(dir)
+    return(loadPlayerFile(dir, playerMatchTables[kind]))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: getPlayerMatchTotals
+# This function gets the batting or bowling totals of the players of a directory
+#
+###########################################################################################
+def getPlayerMatchTotals(dir, kind='batting'):
+    '''
+    Get the batting or bowling totals of each player and team in the matches of a directory, 
+    which are kept up to date with updatePlayerMatchTables()
+    '''
+    if kind not in playerMatchTotals:
+        raise ValueError("kind must be 'batting' or 'bowling' : %s" % kind)
+    updatePlayerMatchTables(dir)
+    return(loadPlayerFile(dir, playerMatchTotals[kind]))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: rankPlayers
+# This function ranks the batsmen or bowlers of a league
+#
+###########################################################################################
+def rankPlayers(dir1,league=None,kind='batting',minMatches=1,sortBy=None,startDate=None,endDate=None,teams=None,rebuild=False):
+    '''
+    Rank the batsmen or bowlers of a league
+    
+    Description
+    
+    This function ranks the batsmen by their mean runs and strike rate, or the bowlers by their
+    mean wickets and economy rate, in the matches of a directory. The ranking over all the 
+    matches is computed from the running totals of the players, which are updated as new 
+    matches are converted. A ranking over a window of dates is computed from the player-match 
+    table of the directory
+    
+    Usage
+    
+    rankPlayers(dir1,league=None,kind='batting',minMatches=1,sortBy=None,startDate=None,endDate=None,teams=None,rebuild=False)
+    Arguments
+    
+    dir1	
+    The directory of the converted matches
+    league	
+    The league whose teams are ranked, one of 'IPL', 'Intl', 'NTB' and 'BBL'. All teams are 
+    ranked if league and teams are None
+    kind	
+    'batting' or 'bowling'
+    minMatches	
+    The minimum number of matches of a ranked player
+    sortBy	
+    The columns by which the players are ranked in descending order. The default is 
+    ['runs_mean','SR_mean'] for batting and ['wicket_mean','econrate_mean'] for bowling
+    startDate	
+    Only matches on or after this date e.g. '2016-01-01' are used
+    endDate	
+    Only matches on or before this date are used
+    teams	
+    The list of teams whose players are ranked, instead of the teams of a league
+    rebuild	
+    If rebuild=True the player-match tables and the totals are built again from all the 
+    matches, e.g. to verify the totals which were updated match by match
+    Value
+    
+    ranking The data frame with the matches and the means of each player
+    
+    See Also
+    
+    getPlayerMatchTable
+    rankIPLT20Batting
+    rankIPLT20Bowling
+    Examples
+    
+    rankPlayers("../data",league='IPL',minMatches=41)
+    # Verify the ranking with the tables built again from all the matches
+    rankPlayers("../data",league='IPL',minMatches=41,rebuild=True)
+    # Rank the IPL bowlers in the 2017 and 2018 seasons
+    rankPlayers("../data",league='IPL',kind='bowling',minMatches=10,startDate='2017-01-01',endDate='2018-12-31')
+    '''
+    player, count, values = rankingColumns[kind]
+    if rebuild:
+        buildPlayerMatchTables(dir1)
+    if league is not None:
+        teams = leagueTeams[league]
+    columns = ['matches'] + [value + '_mean' for value in values]
+    if sortBy is None:
+        sortBy = [value + '_mean' for value in values]
+    if startDate is None and endDate is None:
+        # The means over all the matches are computed from the totals of the players
+        totals = getPlayerMatchTotals(dir1, kind)
+        if teams is not None:
+            totals = totals[totals.index.get_level_values('team').isin(teams)]
+        sums = totals.groupby(level=player).sum()
+        df3 = pd.DataFrame({'matches': sums[count + '_count']})
+        for value in values:
+            df3[value + '_mean'] = sums[value + '_sum'] / sums[value + '_count']
+        df3 = df3[df3['matches']>=minMatches]
+        return(df3.sort_values(sortBy,ascending=False))
+
+    table = getPlayerMatchTable(dir1, kind)
+    if teams is not None and len(table) != 0:
+        table = table[table.team.isin(teams)]
+    # The dates of the table are text like 2016-04-09, which sort like the dates
+    if startDate is not None and len(table) != 0:
+        table = table[table.date >= str(pd.Timestamp(startDate).date())]
+    if endDate is not None and len(table) != 0:
+        table = table[table.date <= str(pd.Timestamp(endDate).date())]
+    if len(table) == 0:
+        return(pd.DataFrame(columns=columns))
+
+    df1=table.groupby(player)[values].agg(['count','mean'])
+    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
+    df2 =df1[[count + '_count'] + [value + '_mean' for value in values]]
+    df3=df2[df2[count + '_count']>=minMatches]
+    df3.columns=columns
+    df4=df3.sort_values(sortBy,ascending=False)
+    return(df4)
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: rankPlayersAsOf
+# This function ranks the batsmen or bowlers of a league as of each of a series of dates
+#
+###########################################################################################
+def rankPlayersAsOf(dir1,dates,league=None,kind='batting',minMatches=1,window=None,sortBy=None,teams=None,top=None):
+    '''
+    Rank the batsmen or bowlers of a league as of each of a series of dates
+    
+    Description
+    
+    This function ranks the players as rankPlayers() does, with the matches up to each of the 
+    dates, or with the matches in a rolling window before each date. The totals of each player
+    are summed over the dates of the player-match table once. The totals as of a date, or in a 
+    window, are then looked up in these running sums for all the players and dates at once, 
+    so that a ranking for hundreds of dates takes about as long as a single ranking
+    
+    Usage
+    
+    rankPlayersAsOf(dir1,dates,league=None,kind='batting',minMatches=1,window=None,sortBy=None,teams=None,top=None)
+    Arguments
+    
+    dir1	
+    The directory of the converted matches
+    dates	
+    The date, or list of dates, as of which the players are ranked e.g. '2018-05-01'
+    league	
+    The league whose teams are ranked, one of 'IPL', 'Intl', 'NTB' and 'BBL'. All teams are 
+    ranked if league and teams are None
+    kind	
+    'batting' or 'bowling'
+    minMatches	
+    The minimum number of matches of a ranked player as of a date
+    window	
+    If window is given only the matches after date - window and up to the date are used e.g. 
+    '365D' or pd.DateOffset(years=2). All the matches up to the date are used if None
+    sortBy	
+    The columns by which the players are ranked in descending order. The default is 
+    ['runs_mean','SR_mean'] for batting and ['wicket_mean','econrate_mean'] for bowling
+    teams	
+    The list of teams whose players are ranked, instead of the teams of a league
+    top	
+    If top is given only the top players as of each date are returned
+    Value
+    
+    ranking The data frame with the date, the player, the matches, the means and the rank of
+    each player as of each date
+    
+    See Also
+    
+    rankPlayers
+    getPlayerMatchTable
+    Examples
+    
+    # The top 10 IPL batsmen as of the start of each month
+    rankPlayersAsOf("../data",pd.date_range('2015-01-01','2019-12-01',freq='MS'),league='IPL',top=10)
+    # The top IPL bowlers over the last 2 seasons
+    rankPlayersAsOf("../data",'2019-06-01',league='IPL',kind='bowling',window=pd.DateOffset(years=2))
+    '''
+    player, count, values = rankingColumns[kind]
+    if league is not None:
+        teams = leagueTeams[league]
+    if sortBy is None:
+        sortBy = [value + '_mean' for value in values]
+    means = [value + '_mean' for value in values]
+    table = getPlayerMatchTable(dir1, kind)
+    if teams is not None and len(table) != 0:
+        table = table[table.team.isin(teams)]
+    if len(table) == 0:
+        return(pd.DataFrame(columns=['date', player, 'matches'] + means + ['rank']))
+
+    # The totals of each player on each day, and their running sums over the days
+    days = pd.to_datetime(table.date).values.astype('datetime64[D]').astype('int64')
+    rows = pd.DataFrame({player: table[player].astype(str).values, 'day': days})
+    for value in values:
+        rows[value + '_count'] = table[value].notna().values.astype('int64')
+        rows[value + '_sum'] = table[value].fillna(0).values.astype('float64')
+    daily = rows.groupby([player, 'day']).sum()
+    sums = daily.groupby(level=0).cumsum()
+    codes, players = pd.factorize(sums.index.get_level_values(0), sort=True)
+    sumDays = sums.index.get_level_values(1).values
+    values2d = sums.values
+
+    asOf = pd.DatetimeIndex(pd.to_datetime(np.atleast_1d(dates))).unique().sort_values()
+    asOfDays = asOf.values.astype('datetime64[D]').astype('int64')
+    startDays = None
+    if window is not None:
+        if isinstance(window, str):
+            window = pd.tseries.frequencies.to_offset(window)
+        startDays = (asOf - window).values.astype('datetime64[D]').astype('int64')
+
+    # The running sums of each player are looked up for all the players and dates at once, with
+    # the player and the day in a single sorted key
+    low = min(sumDays.min(), asOfDays.min() if startDays is None else startDays.min()) - 1
+    span = max(sumDays.max(), asOfDays.max()) - low + 1
+    keys = codes * span + (sumDays - low)
+    gridCodes = np.repeat(np.arange(len(players)), len(asOf))
+
+    def sumsAsOf(lookupDays):
+        position = np.searchsorted(keys, gridCodes * span + (np.tile(lookupDays, len(players)) - low),
+                                   side='right') - 1
+        found = (position >= 0) & (codes[position.clip(0)] == gridCodes)
+        return(values2d[position.clip(0)] * found[:, None])
+
+    totals = sumsAsOf(asOfDays)
+    if startDays is not None:
+        # The matches up to the start of the window are taken off
+        totals = totals - sumsAsOf(startDays)
+    totals = pd.DataFrame(totals, columns=sums.columns)
+
+    df = pd.DataFrame({'date': np.tile(asOf.values, len(players)),
+                       player: np.repeat(players.values, len(asOf)),
+                       'matches': totals[count + '_count'].round().astype('int64')})
+    for value in values:
+        df[value + '_mean'] = totals[value + '_sum'] / totals[value + '_count']
+    df = df[(df['matches'] > 0) & (df['matches'] >= minMatches)]
+    df = df.sort_values(['date'] + sortBy, ascending=[True] + [False] * len(sortBy), kind='mergesort')
+    df['rank'] = df.groupby('date').cumcount() + 1
+    if top is not None:
+        df = df[df['rank'] <= top]
+    return(df.reset_index(drop=True))
+
+##########################################################################################
+# Date : 18 Oct 2026
+# Function: rankFielders
+# This function ranks the fielders of a league
+#
+###########################################################################################
+def rankFielders(dir1,league=None,sortBy=None,startDate=None,endDate=None,teams=None):
+    '''
+    Rank the fielders of a league
+
+    Description
+    
+    This function ranks the fielders by their catches, stumpings and run outs in the matches 
+    of a directory. The fielders are taken from the dismissal table of the directory, which is 
+    built once when the matches are converted and updated with updatePlayerMatchTables(), so 
+    the fielders of the matches are not parsed again for each ranking
+    
+    Usage
+    
+    rankFielders(dir1,league=None,sortBy=None,startDate=None,endDate=None,teams=None)
+    Arguments
+    
+    dir1	
+    The directory of the converted matches
+    league	
+    The league whose fielders are ranked, one of 'IPL', 'Intl', 'NTB' and 'BBL'. All fielders 
+    are ranked if league and teams are None
+    sortBy	
+    The columns by which the fielders are ranked in descending order. The default is 
+    ['total','catches']
+    startDate	
+    Only matches on or after this date e.g. '2016-01-01' are used
+    endDate	
+    Only matches on or before this date are used
+    teams	
+    The list of teams whose fielders are ranked, instead of the teams of a league
+    Value
+    
+    ranking The data frame with the catches, stumpings, runOuts, soleFielderRunOuts and total 
+    of each fielder. soleFielderRunOuts are the run outs in which the fielder was the only 
+    fielder named, which approximates the direct hits as Cricsheet does not mark them
+    
+    See Also
+    
+    fieldingScorecards
+    getDismissals
+    rankPlayers
+    Examples
+    
+    rankFielders("../data",league='IPL')
+    # The wicket keepers of the 2017 and 2018 seasons
+    rankFielders("../data",league='IPL',sortBy=['stumpings'],startDate='2017-01-01',endDate='2018-12-31')
+    '''
+    if league is not None:
+        teams = leagueTeams[league]
+    if sortBy is None:
+        sortBy = ['total', 'catches']
+    table = getPlayerMatchTable(dir1, 'dismissals')
+    if teams is not None and len(table) != 0:
+        table = table[table.fieldingTeam.isin(teams)]
+    # The dates of the table are text like 2016-04-09, which sort like the dates
+    if startDate is not None and len(table) != 0:
+        table = table[table.date >= str(pd.Timestamp(startDate).date())]
+    if endDate is not None and len(table) != 0:
+        table = table[table.date <= str(pd.Timestamp(endDate).date())]
+    if len(table) == 0:
+        return(pd.DataFrame(columns=['catches','stumpings','runOuts','soleFielderRunOuts','total']))
+    df = getFieldingScorecard(table).set_index('fielder')
+    return(df.sort_values(sortBy,ascending=False))
+
 ##########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 28 Feb 2020
@@ -5171,31 +7795,9 @@ def saveAllMatchesAllOppositionNWBT20(dir1):
 #
 ###########################################################################################                
 
-def rankIntlT20Batting(dir1):      
-    countries ={"India":"india", "United States of America":"usa", "Canada":"canada", "United Arab Emirates":"uae",
-                "Afghanistan":"afghanistan", "West Indies":"westindies","Oman":"oman","Germany":"germany",
-                "Namibia":"namibia","Germany":"germany","Sri Lanka":"sl","Singapore":"singapore",
-                "Malaysia":"malaysia","South Africa": "sa","Netherlands":"netherlands",
-                "Zimbabwe":"zimbabwe","Pakistan":"pakistan","Scotland":"scotland","Kuwait":"kuwait",
-                "New Zealand":"nz","Vanuatu":"vanuatu","Papua New Guinea": "png","Australia":"aus",
-                "Irelaand":"ireland","England":"england","South Korea":"sk","Japan":"japan","Bangladesh":"bangladesh",
-                "Nepal":"nepal","Cayman Island":"cayman","Rwanda":"rwanda","Qatar":"qatar","Botswana":"botswana",
-                "Rwanda":"rwanda","Uganda":"uganda","Maldives":"maldives","Fiji":"fiji","Mozambique":"mozam",
-                "Hong Kong":"hk","Denmark":"denmark","Norway":"norway"
-                }
-    
-    df=pd.DataFrame()
-    for key in countries:
-        val = countries[key] + "_details"
-        val= getTeamBattingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-    df1=df.groupby('batsman').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['runs_count','runs_mean','SR_mean']]
-    df3=df2[df2['runs_count']>40]
-    df4=df3.sort_values(['runs_mean','SR_mean'],ascending=False)
-    df4.columns=['matches','runs_mean','SR_mean']
-    return(df4)
+def rankIntlT20Batting(dir1):
+    # The batsmen with more than 40 matches are ranked
+    return(rankPlayers(dir1,league='Intl',kind='batting',minMatches=41))
     
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -5205,29 +7807,8 @@ def rankIntlT20Batting(dir1):
 #
 ###########################################################################################   
 def rankIntlT20Bowling(dir1):
-    countries ={"India":"india", "United States of America":"usa", "Canada":"canada", "United Arab Emirates":"uae",
-                    "Afghanistan":"afghanistan", "West Indies":"westindies","Oman":"oman","Germany":"germany",
-                    "Namibia":"namibia","Germany":"germany","Sri Lanka":"sl","Singapore":"singapore",
-                    "Malaysia":"malaysia","South Africa": "sa","Netherlands":"netherlands",
-                    "Zimbabwe":"zimbabwe","Pakistan":"pakistan","Scotland":"scotland","Kuwait":"kuwait",
-                    "New Zealand":"nz","Vanuatu":"vanuatu","Papua New Guinea": "png","Australia":"aus",
-                    "Irelaand":"ireland","England":"england","South Korea":"sk","Japan":"japan","Bangladesh":"bangladesh",
-                    "Nepal":"nepal","Cayman Island":"cayman","Rwanda":"rwanda","Qatar":"qatar","Botswana":"botswana",
-                    "Rwanda":"rwanda","Uganda":"uganda","Maldives":"maldives","Fiji":"fiji","Mozambique":"mozam",
-                    "Hong Kong":"hk","Denmark":"denmark","Norway":"norway"
-                    }
-    df=pd.DataFrame()
-    for key in countries:
-        val = countries[key] + "_details"
-        val= getTeamBowlingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-    df1=df.groupby('bowler').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['wicket_count','wicket_mean','econrate_mean']]
-    df3=df2[df2['wicket_count']>40]
-    df4=df3.sort_values(['wicket_mean','econrate_mean'],ascending=False)
-    df4.columns=['matches','wicket_mean','econrate_mean']
-    return(df4)
+    # The bowlers with more than 40 matches are ranked
+    return(rankPlayers(dir1,league='Intl',kind='bowling',minMatches=41))
     
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -5237,27 +7818,10 @@ def rankIntlT20Bowling(dir1):
 #
 ###########################################################################################
 
-def rankIPLT20Batting(dir1):      
-
-    iplTeams ={"Chennai Super Kings":"csk","Deccan Chargers":"dc","Delhi Daredevils":"dd",
-                  "Kings XI Punjab":"kxip", 'Kochi Tuskers Kerala':"kct","Kolkata Knight Riders":"kkr",
-                  "Mumbai Indians":"mi", "Pune Warriors":"pw","Rajasthan Royals":"rr",
-                  "Royal Challengers Bangalore":"rps","Sunrisers Hyderabad":"sh","Gujarat Lions":"gl",
-                  "Rising Pune Supergiants":"rps"}
+def rankIPLT20Batting(dir1):
+    # The batsmen with more than 40 matches are ranked
+    return(rankPlayers(dir1,league='IPL',kind='batting',minMatches=41))
     
-    df=pd.DataFrame()
-    for key in iplTeams:
-        val = iplTeams[key] + "_details"
-        val= getTeamBattingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-    df1=df.groupby('batsman').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['runs_count','runs_mean','SR_mean']]
-    df3=df2[df2['runs_count']>40]
-    df4=df3.sort_values(['runs_mean','SR_mean'],ascending=False)
-    df4.columns=['matches','runs_mean','SR_mean']
-    return(df4)    
-
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 28 Feb 2020
@@ -5267,24 +7831,8 @@ def rankIPLT20Batting(dir1):
 ###########################################################################################
     
 def rankIPLT20Bowling(dir1):
-    iplTeams ={"Chennai Super Kings":"csk","Deccan Chargers":"dc","Delhi Daredevils":"dd",
-                  "Kings XI Punjab":"kxip", 'Kochi Tuskers Kerala':"kct","Kolkata Knight Riders":"kkr",
-                  "Mumbai Indians":"mi", "Pune Warriors":"pw","Rajasthan Royals":"rr",
-                  "Royal Challengers Bangalore":"rps","Sunrisers Hyderabad":"sh","Gujarat Lions":"gl",
-                  "Rising Pune Supergiants":"rps"}
-                    
-    df=pd.DataFrame()
-    for key in iplTeams:
-        val = iplTeams[key] + "_details"
-        val= getTeamBowlingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-    df1=df.groupby('bowler').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['wicket_count','wicket_mean','econrate_mean']]
-    df3=df2[df2['wicket_count']>40]
-    df4=df3.sort_values(['wicket_mean','econrate_mean'],ascending=False)
-    df4.columns=['matches','wicket_mean','econrate_mean']
-    return(df4)
+    # The bowlers with more than 40 matches are ranked
+    return(rankPlayers(dir1,league='IPL',kind='bowling',minMatches=41))
     
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -5294,27 +7842,9 @@ def rankIPLT20Bowling(dir1):
 #
 ###########################################################################################
     
-def rankNTBT20Batting(dir1):      
-
-    ntbTeams = {"Derbyshire":"der", "Durham":"dur", "Essex":"ess", "Glamorgan":"gla",
-             "Gloucestershire":"glo", "Hampshire":"ham", "Kent":"ken","Lancashire":"lan",
-             "Leicestershire":"lei", "Middlesex":"mid","Northamptonshire":"nor",
-             "Nottinghamshire":"not","Somerset":"som","Surrey":"sur","Sussex":"sus","Warwickshire":"war",
-             "Worcestershire":"wor","Yorkshire":"yor"}
-    
-    df=pd.DataFrame()
-    for key in ntbTeams:
-        val = ntbTeams[key] + "_details"
-        val= getTeamBattingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-        
-    df1=df.groupby('batsman').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['runs_count','runs_mean','SR_mean']]
-    df3=df2[df2['runs_count']>10]
-    df4=df3.sort_values(['runs_mean','SR_mean'],ascending=False)
-    df4.columns=['matches','runs_mean','SR_mean']
-    return(df4)  
+def rankNTBT20Batting(dir1):
+    # The batsmen with more than 10 matches are ranked
+    return(rankPlayers(dir1,league='NTB',kind='batting',minMatches=11))
     
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -5325,25 +7855,9 @@ def rankNTBT20Batting(dir1):
 ###########################################################################################
     
 def rankNTBT20Bowling(dir1):
-    ntbTeams = {"Derbyshire":"der", "Durham":"dur", "Essex":"ess", "Glamorgan":"gla",
-             "Gloucestershire":"glo", "Hampshire":"ham", "Kent":"ken","Lancashire":"lan",
-             "Leicestershire":"lei", "Middlesex":"mid","Northamptonshire":"nor",
-             "Nottinghamshire":"not","Somerset":"som","Surrey":"sur","Sussex":"sus","Warwickshire":"war",
-             "Worcestershire":"wor","Yorkshire":"yor"}
-                    
-    df=pd.DataFrame()
-    for key in ntbTeams:
-        val = ntbTeams[key] + "_details"
-        val= getTeamBowlingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-    df1=df.groupby('bowler').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['wicket_count','wicket_mean','econrate_mean']]
-    df3=df2[df2['wicket_count']>10]
-    df4=df3.sort_values(['wicket_mean','econrate_mean'],ascending=False)
-    df4.columns=['matches','wicket_mean','econrate_mean']
-    return(df4)
-
+    # The bowlers with more than 10 matches are ranked
+    return(rankPlayers(dir1,league='NTB',kind='bowling',minMatches=11))
+    
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
 # Date : 28 Feb 2020
@@ -5352,26 +7866,9 @@ def rankNTBT20Bowling(dir1):
 #
 ###########################################################################################
 
-def rankBBLT20Batting(dir1):      
-
-    bbTteams = {"Adelaide Strikers":"as", "Brisbane Heat":"bh", "Hobart Hurricanes":"hh",
-             "Melbourne Renegades":"mr", "Perth Scorchers":"ps", "Sydney Sixers":"ss",
-             "Sydney Thunder":"st"}
-    
-    
-    df=pd.DataFrame()
-    for key in bbTteams:
-        val = bbTteams[key] + "_details"
-        val= getTeamBattingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-        
-    df1=df.groupby('batsman').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['runs_count','runs_mean','SR_mean']]
-    df3=df2[df2['runs_count']>20]
-    df4=df3.sort_values(['runs_mean','SR_mean'],ascending=False)
-    df4.columns=['matches','runs_mean','SR_mean']
-    return(df4) 
+def rankBBLT20Batting(dir1):
+    # The batsmen with more than 20 matches are ranked
+    return(rankPlayers(dir1,league='BBL',kind='batting',minMatches=21))
     
 #########################################################################################
 # Designed and developed by Tinniam V Ganesh
@@ -5382,21 +7879,6 @@ def rankBBLT20Batting(dir1):
 ###########################################################################################
     
 def rankBBLT20Bowling(dir1):
-    bbTteams = {"Adelaide Strikers":"as", "Brisbane Heat":"bh", "Hobart Hurricanes":"hh",
-             "Melbourne Renegades":"mr", "Perth Scorchers":"ps", "Sydney Sixers":"ss",
-             "Sydney Thunder":"st"}
-                    
-    df=pd.DataFrame()
-    for key in bbTteams:
-        val = bbTteams[key] + "_details"
-        val= getTeamBowlingDetails(key,dir=dir1, save=False,odir=".")
-        df = pd.concat([df,val])
-    df1=df.groupby('bowler').agg(['count','mean'])
-    df1.columns = ['_'.join(col).strip() for col in df1.columns.values]
-    df2 =df1[['wicket_count','wicket_mean','econrate_mean']]
-
-    df3=df2[df2['wicket_count']>10]
-    df4=df3.sort_values(['wicket_mean','econrate_mean'],ascending=False)
-    df4.columns=['matches','wicket_mean','econrate_mean']
-    return(df4)
+    # The bowlers with more than 10 matches are ranked
+    return(rankPlayers(dir1,league='BBL',kind='bowling',minMatches=11))
     